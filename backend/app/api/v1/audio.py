@@ -6,27 +6,73 @@ Step 1: 콘텐츠 → 3분 분량의 뉴스 스크립트 생성
 Step 2: TTS 음성 합성 (OpenAI gpt-4o-mini-tts)
 """
 
+import asyncio
 import hashlib
-import json
 import time
-from collections.abc import AsyncGenerator
-from datetime import datetime
-
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable
+from typing import Annotated, Any
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import (
+    FileResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from app.api.v1.common import (
+    EV_CONTENT,
+    EV_DONE,
+    EV_ERROR,
+    EV_PARAGRAPH,
+    EV_THINKING,
+    EV_TITLE,
+    SSE_HEADERS,
+    encode_sse,
+    hash_article_id,
+)
 from app.core.config import settings
-from app.services.audio import AudioService, get_audio_service
-from app.services.storage import GCSStorageService, get_storage_service
+from app.services.audio import AudioService, ScriptStreamParser, get_audio_service
+from app.services.storage import (
+    GCSStorageService,
+    StorageService,
+    encode_json,
+    get_storage_service,
+    now_with_path_timestamp,
+)
 from output_schemas.audio import NewsScript
 
-router = APIRouter(prefix="/audio", tags=["audio"])
+router = APIRouter(
+    prefix="/audio", tags=["audio"], default_response_class=ORJSONResponse
+)
 
 # 기본 사용자 ID (프로토타입용)
 DEFAULT_USER_ID = "default"
 
+# 스크립트 JSON 캐시 설정
+SCRIPT_CACHE_MAXSIZE = 1024
+SCRIPT_CACHE_TTL_SEC = 300
+
+# (user_id, article_id) → 최신 스크립트 데이터
+_script_cache: TTLCache = TTLCache(
+    maxsize=SCRIPT_CACHE_MAXSIZE, ttl=SCRIPT_CACHE_TTL_SEC
+)
+# (user_id, article_id) → 최신 스크립트 파일 경로 (list_files 생략용)
+_script_path_cache: TTLCache = TTLCache(
+    maxsize=SCRIPT_CACHE_MAXSIZE, ttl=SCRIPT_CACHE_TTL_SEC
+)
+
+# (user_id, article_id, 스크립트 버전) → 진행 중인 TTS 합성 Task (중복 요청 병합용)
+_synthesize_inflight: dict[Hashable, asyncio.Task] = {}
+# 콘텐츠 해시 → 진행 중인 스크립트 생성 Task (중복 요청 병합용)
+_script_inflight: dict[Hashable, asyncio.Task] = {}
+
+# 응답 이후 실행되는 백그라운드 Task (GC 방지용 참조)
+_background_tasks: set[asyncio.Task] = set()
+
 
 # ============================================================================
 # Request/Response Schemas
@@ -84,7 +130,10 @@ class GenerateScriptResponse(BaseModel):
     )
     saved_path: str | None = Field(
         None,
-        description="저장된 파일 경로 (저장 실패 시 None)",
+        description=(
+            "저장된 파일 경로 (저장 실패 시 None). "
+            "/script는 응답 후 백그라운드로 저장하므로 항상 None"
+        ),
     )
 
 
@@ -146,15 +195,66 @@ def _generate_article_id(url: str | None, content: str) -> str:
     Returns:
         생성된 article_id
     """
-    if url:
-        # URL 기반 해시 (앞 8자리)
-        hash_input = url
-    else:
-        # content 기반 해시 (앞 8자리)
-        hash_input = content[:500]  # 앞 500자만 사용
+    # URL 기반 해시, 없으면 content 앞 500자 기반 해시
+    # (전체 content를 인코딩하지 않도록 문자 단위로 먼저 자름)
+    return hash_article_id(url or content[:500], "script")
+
+
+def _script_request_key(content: str, original_content: str | None) -> str:
+    """
+    스크립트 생성 요청 병합용 키를 생성합니다.
 
-    hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:8]
-    return f"script_{hash_value}"
+    같은 (content, original_content)로 동시에 들어온 요청은 같은 키를 가집니다.
+
+    Args:
+        content: 콘텐츠 텍스트
+        original_content: 원본 외부 링크 콘텐츠
+
+    Returns:
+        콘텐츠 해시 (hex)
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(content.encode("utf-8", "surrogatepass"))
+    hasher.update(b"\x00")
+    hasher.update((original_content or "").encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()
+
+
+def _get_script_storage_path(
+    user_id: str, article_id: str, timestamp: str | None = None
+) -> str:
+    """
+    새 스크립트 JSON의 스토리지 경로를 생성합니다.
+
+    Args:
+        user_id: 사용자 ID
+        article_id: 아티클 ID
+        timestamp: 파일명 timestamp (None이면 현재 시각)
+
+    Returns:
+        스토리지 경로 (예: users/default/audio/script_xxx_2025-01-01T00-00-00.json)
+    """
+    if timestamp is None:
+        _, timestamp = now_with_path_timestamp()
+    return f"users/{user_id}/audio/{article_id}_{timestamp}.json"
+
+
+def _spawn_background(coro: Awaitable[Any]) -> asyncio.Task:
+    """
+    응답과 무관한 작업을 백그라운드 Task로 실행합니다.
+
+    Task가 GC되지 않도록 완료될 때까지 참조를 보관합니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        생성된 Task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 async def _save_script_result(
@@ -167,6 +267,10 @@ async def _save_script_result(
     스크립트 결과를 저장합니다 (StorageService 사용).
 
     저장 경로: users/{user_id}/audio/{article_id}_{timestamp}.json
+    최신 포인터: users/{user_id}/audio/{article_id}.latest.json
+
+    첫 await 이전에 캐시를 먼저 채우므로, 백그라운드로 실행해도
+    바로 이어지는 /synthesize 요청은 캐시에서 스크립트를 찾습니다.
 
     Args:
         article_id: 아티클 ID
@@ -177,40 +281,98 @@ async def _save_script_result(
     Returns:
         저장된 경로 (실패 시 None)
     """
+    cache_key = (user_id, article_id)
+    now, timestamp = now_with_path_timestamp()
+    path = _get_script_storage_path(user_id, article_id, timestamp)
+
+    # 저장할 데이터 구성
+    save_data = {
+        "user_id": user_id,
+        "article_id": article_id,
+        "url": url,
+        "created_at": now.isoformat(),
+        **result,
+    }
+
+    # 캐시 갱신: 저장 완료를 기다리지 않고 최신 데이터/경로로 교체
+    _script_cache[cache_key] = save_data
+    _script_path_cache[cache_key] = path
+
     try:
         storage = get_storage_service()
 
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        filename = f"{article_id}_{timestamp}.json"
-
-        # 저장 경로
-        path = f"users/{user_id}/audio/{filename}"
-
-        # 저장할 데이터 구성
-        save_data = {
-            "user_id": user_id,
-            "article_id": article_id,
-            "url": url,
-            "created_at": datetime.now().isoformat(),
-            **result,
-        }
+        # JSON 저장 (orjson으로 직렬화한 bytes를 그대로 업로드)
+        saved_path = await storage.save_bytes(
+            path, encode_json(save_data), content_type="application/json"
+        )
 
-        # JSON 저장
-        saved_path = await storage.save_json(path, save_data)
+        # 최신 포인터 저장 (조회 시 목록 스캔 없이 한 번에 로드)
+        await storage.save_bytes(
+            _get_latest_pointer_path(user_id, article_id),
+            encode_json({"path": path, "data": save_data}),
+            content_type="application/json",
+        )
 
         logger.info(f"스크립트 결과 저장됨: {saved_path}")
         return saved_path
 
     except Exception as e:
+        # 저장되지 않은 경로를 가리키지 않도록 캐시 제거
+        # (그사이 더 최신 저장이 캐시를 교체했다면 그 항목은 유지)
+        if _script_cache.get(cache_key) is save_data:
+            _script_cache.pop(cache_key, None)
+        if _script_path_cache.get(cache_key) == path:
+            _script_path_cache.pop(cache_key, None)
         logger.error(f"스크립트 결과 저장 실패: {e}")
         return None
 
 
+def _build_news_script(script_dict: dict) -> NewsScript:
+    """
+    저장된 스크립트 딕셔너리로 NewsScript를 만듭니다.
+
+    _save_script_result가 검증된 모델을 덤프해 저장한 데이터이므로
+    필드가 모두 있으면 재검증 없이 model_construct로 생성하고,
+    형태가 예상과 다르면(구버전 데이터 등) 전체 검증으로 폴백합니다.
+
+    Args:
+        script_dict: 저장된 script 딕셔너리
+
+    Returns:
+        NewsScript 인스턴스
+
+    Raises:
+        ValidationError: 전체 검증에 실패한 경우
+    """
+    if NewsScript.model_fields.keys() <= script_dict.keys() and isinstance(
+        script_dict.get("paragraphs"), list
+    ):
+        return NewsScript.model_construct(**script_dict)
+    return NewsScript.model_validate(script_dict)
+
+
+def _get_latest_pointer_path(user_id: str, article_id: str) -> str:
+    """
+    최신 스크립트 포인터 파일의 스토리지 경로를 반환합니다.
+
+    Args:
+        user_id: 사용자 ID
+        article_id: 아티클 ID
+
+    Returns:
+        스토리지 경로 (예: users/default/audio/script_xxx.latest.json)
+    """
+    return f"users/{user_id}/audio/{article_id}.latest.json"
+
+
 async def _find_latest_script_json(user_id: str, article_id: str) -> dict | None:
     """
     가장 최근에 저장된 스크립트 JSON 파일을 찾아 로드합니다 (StorageService 사용).
 
+    반복 요청 시 storage 조회를 생략하도록 TTL 캐시를 먼저 확인하고,
+    캐시 미스 시에는 최신 포인터 파일을 읽어 목록 조회를 생략합니다.
+    캐시는 이벤트 루프 스레드에서만 접근하므로 별도 Lock을 사용하지 않습니다.
+
     Args:
         user_id: 사용자 ID
         article_id: 아티클 ID
@@ -218,21 +380,47 @@ async def _find_latest_script_json(user_id: str, article_id: str) -> dict | None
     Returns:
         스크립트 데이터 딕셔너리 (없으면 None)
     """
+    cache_key = (user_id, article_id)
+
+    # 캐시 확인
+    cached = _script_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     storage = get_storage_service()
-    prefix = f"users/{user_id}/audio/"
-    pattern = f"{article_id}_*.json"
 
-    # 파일 목록 조회
-    files = await storage.list_files(prefix, pattern)
+    # 최신 파일 경로가 캐시되어 있지 않으면 포인터 파일 확인
+    latest_file = _script_path_cache.get(cache_key)
+    if latest_file is None:
+        pointer = await storage.load_json(_get_latest_pointer_path(user_id, article_id))
+        if pointer and pointer.get("data") is not None:
+            script_data = pointer["data"]
+            _script_cache[cache_key] = script_data
+            _script_path_cache[cache_key] = pointer.get("path")
+            return script_data
 
-    if not files:
-        return None
+    # 포인터가 없는 기존 데이터는 파일 목록에서 최신 파일 선택
+    if latest_file is None:
+        prefix = f"users/{user_id}/audio/"
+        pattern = f"{article_id}_*.json"
+
+        # 파일 목록 조회
+        files = await storage.list_files(prefix, pattern)
 
-    # 가장 최근 파일 선택 (파일명 기준 정렬 - timestamp가 포함되어 있음)
-    latest_file = sorted(files)[-1]
+        if not files:
+            return None
+
+        # 가장 최근 파일 선택 (파일명에 timestamp가 포함되어 사전순 최대값이 최신)
+        latest_file = max(files)
 
     # JSON 로드
-    return await storage.load_json(latest_file)
+    script_data = await storage.load_json(latest_file)
+
+    if script_data is not None:
+        _script_cache[cache_key] = script_data
+        _script_path_cache[cache_key] = latest_file
+
+    return script_data
 
 
 def _get_audio_storage_path(user_id: str, article_id: str) -> str:
@@ -249,13 +437,110 @@ def _get_audio_storage_path(user_id: str, article_id: str) -> str:
     return f"users/{user_id}/audio/{article_id}.mp3"
 
 
+async def _find_fresh_audio_meta(
+    user_id: str, article_id: str, script_data: dict
+) -> dict | None:
+    """
+    최신 스크립트로 합성된 오디오의 메타데이터를 반환합니다.
+
+    synthesize_speech가 MP3 저장 후 기록하는 사이드카
+    (users/{user_id}/audio/{article_id}.meta.json)를 읽으므로
+    MP3를 디코딩하지 않고 길이/크기를 알 수 있습니다.
+
+    합성 시각은 스크립트 저장 시각과 순서가 보장되지 않으므로(이전 스크립트를
+    합성하는 중에 새 스크립트가 저장될 수 있음) 사이드카에 기록된 스크립트
+    버전이 최신 스크립트의 created_at과 정확히 일치할 때만 재사용합니다.
+
+    Args:
+        user_id: 사용자 ID
+        article_id: 아티클 ID
+        script_data: 최신 스크립트 데이터 (created_at 비교용)
+
+    Returns:
+        메타데이터 딕셔너리 (없거나, 다른 스크립트로 합성되었거나,
+        MP3 파일이 없으면 None)
+    """
+    script_version = script_data.get("created_at")
+    if script_version is None:
+        return None
+
+    storage = get_storage_service()
+    meta = await storage.load_json(f"users/{user_id}/audio/{article_id}.meta.json")
+    if not meta or meta.get("script_version") != script_version:
+        return None
+
+    # 사이드카만 남고 MP3가 삭제된 경우 재합성 (GCS는 HTTP 호출이므로 스레드에서 실행)
+    audio_path = _get_audio_storage_path(user_id, article_id)
+    if not await asyncio.to_thread(storage.exists, audio_path):
+        return None
+    return meta
+
+
+async def _run_singleflight(
+    inflight: dict[Hashable, asyncio.Task],
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    같은 키로 동시에 들어온 요청을 하나의 작업으로 병합합니다.
+
+    첫 요청만 factory()를 실행하고, 이후 중복 요청은 같은 Task의 결과
+    (또는 예외)를 함께 받습니다. 한 클라이언트가 연결을 끊어도 공유 작업은
+    취소되지 않도록 shield로 감쌉니다.
+
+    Args:
+        inflight: 키별 진행 중 Task 저장소
+        key: 병합 키 (예: (user_id, article_id))
+        factory: 실제 작업 코루틴을 생성하는 함수
+
+    Returns:
+        작업 결과
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        inflight[key] = task
+
+        def _cleanup(done: asyncio.Task) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+
+        task.add_done_callback(_cleanup)
+    else:
+        logger.info(f"진행 중인 동일 요청에 합류: key={key}")
+
+    return await asyncio.shield(task)
+
+
+async def _audio_service_dep() -> AudioService:
+    """
+    AudioService 의존성입니다.
+
+    FastAPI는 동기 의존성을 스레드풀에서 실행하므로, 요청마다 스레드를
+    거치지 않도록 싱글톤 getter를 async 함수로 감쌉니다.
+    """
+    return get_audio_service()
+
+
+async def _storage_service_dep() -> StorageService:
+    """StorageService 의존성입니다 (_audio_service_dep과 같은 이유로 async)."""
+    return get_storage_service()
+
+
+AudioServiceDep = Annotated[AudioService, Depends(_audio_service_dep)]
+StorageServiceDep = Annotated[StorageService, Depends(_storage_service_dep)]
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
 
 @router.post("/script", response_model=GenerateScriptResponse)
-async def generate_script(request: GenerateScriptRequest) -> GenerateScriptResponse:
+async def generate_script(
+    request: GenerateScriptRequest,
+    service: AudioServiceDep,
+) -> GenerateScriptResponse:
     """
     콘텐츠를 뉴스 스크립트로 변환합니다.
 
@@ -276,7 +561,7 @@ async def generate_script(request: GenerateScriptRequest) -> GenerateScriptRespo
     Returns:
         GenerateScriptResponse: 생성된 뉴스 스크립트 결과
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # user_id 및 article_id 결정
     user_id = request.user_id or DEFAULT_USER_ID
@@ -285,13 +570,17 @@ async def generate_script(request: GenerateScriptRequest) -> GenerateScriptRespo
     )
 
     try:
-        service = get_audio_service()
-        script = await service.generate_script(
-            content=request.content,
-            original_content=request.original_content,
+        # 동일 콘텐츠 동시 요청은 한 번만 생성 (article_id/user_id별 저장은 각자 수행)
+        script = await _run_singleflight(
+            _script_inflight,
+            _script_request_key(request.content, request.original_content),
+            lambda: service.generate_script(
+                content=request.content,
+                original_content=request.original_content,
+            ),
         )
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
         # 스크립트 결과 저장
         result_dict = {
@@ -299,11 +588,15 @@ async def generate_script(request: GenerateScriptRequest) -> GenerateScriptRespo
             "model": service.model_name,
             "processing_time_ms": processing_time_ms,
         }
-        saved_path = await _save_script_result(
-            article_id=article_id,
-            result=result_dict,
-            user_id=user_id,
-            url=request.url,
+        # 저장은 응답과 무관하므로 백그라운드로 실행 (캐시는 즉시 갱신됨)
+        # 저장 성공 여부를 알 수 없으므로 응답의 saved_path는 None
+        _spawn_background(
+            _save_script_result(
+                article_id=article_id,
+                result=result_dict,
+                user_id=user_id,
+                url=request.url,
+            )
         )
 
         logger.info(
@@ -318,7 +611,7 @@ async def generate_script(request: GenerateScriptRequest) -> GenerateScriptRespo
             script=script,
             model=service.model_name,
             processing_time_ms=processing_time_ms,
-            saved_path=str(saved_path) if saved_path else None,
+            saved_path=None,
         )
 
     except ValueError as e:
@@ -340,17 +633,20 @@ async def generate_script(request: GenerateScriptRequest) -> GenerateScriptRespo
 
 async def _generate_script_sse_events(
     request: GenerateScriptRequest,
-) -> AsyncGenerator[str, None]:
+    service: AudioService,
+) -> AsyncGenerator[bytes, None]:
     """
     SSE 이벤트를 생성합니다.
 
     이벤트 형식:
     - thinking: AI의 추론 과정
     - content: 스크립트 텍스트
+    - title: 확정된 스크립트 제목 ([스크립트] 마커 수신 시 1회)
+    - paragraph: 완성된 스크립트 문단 (index, text)
     - done: 완료 및 최종 결과 JSON
     - error: 에러 발생
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # user_id 및 article_id 결정
     user_id = request.user_id or DEFAULT_USER_ID
@@ -358,35 +654,55 @@ async def _generate_script_sse_events(
         request.url, request.content
     )
 
-    full_thinking = ""
-    full_content = ""
+    # str += 반복은 매번 새 문자열을 만들므로 리스트에 모은 뒤 한 번에 join
+    # 스크립트 본문은 parser가 문단 단위로 보관하므로 따로 모으지 않음
+    thinking_parts: list[str] = []
+    parser = ScriptStreamParser()
+    paragraph_index = 0
+    title_sent = False
 
     try:
-        service = get_audio_service()
-
         async for event_type, text in service.generate_script_stream(
             content=request.content,
             original_content=request.original_content,
         ):
-            # 이벤트 데이터 구성
-            event_data = json.dumps({"text": text}, ensure_ascii=False)
-
             if event_type == "thinking":
-                full_thinking += text
-                yield f"event: thinking\ndata: {event_data}\n\n"
+                thinking_parts.append(text)
+                yield encode_sse(EV_THINKING, {"text": text})
             elif event_type == "content":
-                full_content += text
-                yield f"event: content\ndata: {event_data}\n\n"
+                yield encode_sse(EV_CONTENT, {"text": text})
+
+                # 완성된 제목/문단은 스트림 종료를 기다리지 않고 바로 전송
+                new_paragraphs = parser.feed(text)
+                if not title_sent and parser.title is not None:
+                    yield encode_sse(EV_TITLE, {"title": parser.title})
+                    title_sent = True
+                for paragraph in new_paragraphs:
+                    yield encode_sse(
+                        EV_PARAGRAPH, {"index": paragraph_index, "text": paragraph}
+                    )
+                    paragraph_index += 1
 
         # 스트리밍 완료 후 결과 파싱
-        processing_time_ms = int((time.time() - start_time) * 1000)
-
-        # Plain Text를 NewsScript로 파싱
-        result = AudioService.parse_stream_result(full_content)
-
-        # 결과 저장
+        full_thinking = "".join(thinking_parts)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+
+        # 이미 분리된 문단으로 NewsScript 생성 (마커가 없으면 전체 파싱)
+        last_paragraphs, result = parser.finalize()
+        # fallback 파싱 경로에서는 title이 스트림 중에 전송되지 않았을 수 있음
+        if not title_sent:
+            yield encode_sse(EV_TITLE, {"title": result.title})
+            title_sent = True
+        for paragraph in last_paragraphs:
+            yield encode_sse(
+                EV_PARAGRAPH, {"index": paragraph_index, "text": paragraph}
+            )
+            paragraph_index += 1
+
+        # 결과 저장 (저장과 done 이벤트에 같은 dump 재사용)
+        script_dump = result.model_dump()
         result_dict = {
-            "script": result.model_dump(),
+            "script": script_dump,
             "model": service.model_name,
             "processing_time_ms": processing_time_ms,
             "thinking": full_thinking if full_thinking else None,
@@ -399,47 +715,47 @@ async def _generate_script_sse_events(
         )
 
         # 최종 결과 이벤트
-        done_data = json.dumps(
+        yield encode_sse(
+            EV_DONE,
             {
                 "user_id": user_id,
                 "article_id": article_id,
-                "script": result.model_dump(),
+                "script": script_dump,
                 "model": service.model_name,
                 "processing_time_ms": processing_time_ms,
                 "saved_path": str(saved_path) if saved_path else None,
             },
-            ensure_ascii=False,
         )
 
-        yield f"event: done\ndata: {done_data}\n\n"
-
         logger.info(
             f"스트리밍 스크립트 API 완료: {len(result.paragraphs)}개 문단, "
             f"처리시간={processing_time_ms}ms, article_id={article_id}"
         )
 
     except ValueError as e:
-        error_data = json.dumps({"error": str(e)}, ensure_ascii=False)
-        yield f"event: error\ndata: {error_data}\n\n"
+        yield encode_sse(EV_ERROR, {"error": str(e)})
         logger.warning(f"스트리밍 스크립트 요청 오류: {e}")
 
     except Exception as e:
-        error_data = json.dumps(
-            {"error": f"스크립트 처리 중 오류가 발생했습니다: {str(e)}"},
-            ensure_ascii=False,
+        yield encode_sse(
+            EV_ERROR, {"error": f"스크립트 처리 중 오류가 발생했습니다: {str(e)}"}
         )
-        yield f"event: error\ndata: {error_data}\n\n"
         logger.error(f"스트리밍 스크립트 처리 실패: {e}")
 
 
 @router.post("/script/stream")
-async def generate_script_stream(request: GenerateScriptRequest) -> StreamingResponse:
+async def generate_script_stream(
+    request: GenerateScriptRequest,
+    service: AudioServiceDep,
+) -> StreamingResponse:
     """
     SSE 스트리밍으로 뉴스 스크립트를 생성합니다.
 
     ## 이벤트 타입
     - **thinking**: AI의 추론 과정 텍스트
     - **content**: 스크립트 텍스트 청크
+    - **title**: 확정된 스크립트 제목 (1회)
+    - **paragraph**: 완성된 스크립트 문단 (스트림 종료 전 문단 단위로 전송)
     - **done**: 최종 완료 결과 (GenerateScriptResponse와 동일한 구조)
     - **error**: 에러 발생
 
@@ -451,6 +767,12 @@ async def generate_script_stream(request: GenerateScriptRequest) -> StreamingRes
     event: content
     data: {"text": "[제목]\\nAI가 바꾸는 미래..."}
 
+    event: title
+    data: {"title": "AI가 바꾸는 미래"}
+
+    event: paragraph
+    data: {"index": 0, "text": "첫 번째 문단입니다."}
+
     event: done
     data: {"user_id": "default", "article_id": "...", "script": {...}, ...}
     ```
@@ -459,13 +781,9 @@ async def generate_script_stream(request: GenerateScriptRequest) -> StreamingRes
         StreamingResponse with text/event-stream content type
     """
     return StreamingResponse(
-        _generate_script_sse_events(request),
+        _generate_script_sse_events(request, service),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -475,7 +793,10 @@ async def generate_script_stream(request: GenerateScriptRequest) -> StreamingRes
 
 
 @router.post("/synthesize", response_model=SynthesizeResponse)
-async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
+async def synthesize_audio(
+    request: SynthesizeRequest,
+    service: AudioServiceDep,
+) -> SynthesizeResponse:
     """
     저장된 스크립트를 기반으로 TTS 음성을 합성합니다.
 
@@ -488,13 +809,19 @@ async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
     3. 문단 사이에 silence padding 추가
     4. 전체 오디오 병합 후 MP3 저장
 
+    같은 스크립트에 대한 동시 요청은 하나의 합성 작업 결과를 공유합니다.
+
+    최신 스크립트로 합성된 오디오가 이미 있으면 재합성하지 않고
+    저장된 메타데이터로 바로 응답합니다.
+
     ## 저장 경로
     - `users/{user_id}/audio/{article_id}.mp3`
+    - `users/{user_id}/audio/{article_id}.meta.json` (길이/크기 메타데이터)
 
     Returns:
         SynthesizeResponse: 생성된 오디오 파일 정보
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     user_id = request.user_id or DEFAULT_USER_ID
     article_id = request.article_id
@@ -508,6 +835,19 @@ async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
             detail=f"스크립트를 찾을 수 없습니다: article_id={article_id}, user_id={user_id}",
         )
 
+    # 이미 합성된 최신 오디오가 있으면 바로 반환
+    audio_meta = await _find_fresh_audio_meta(user_id, article_id, script_data)
+    if audio_meta is not None:
+        logger.info(f"기존 오디오 재사용: article_id={article_id}, user_id={user_id}")
+        return SynthesizeResponse(
+            audio_url=f"/api/v1/audio/{article_id}.mp3?user_id={user_id}",
+            duration_seconds=audio_meta["duration_sec"],
+            file_size_bytes=audio_meta["file_size_bytes"],
+            user_id=user_id,
+            article_id=article_id,
+            processing_time_ms=int((time.perf_counter() - start_time) * 1000),
+        )
+
     # 스크립트 파싱
     script_dict = script_data.get("script")
     if not script_dict:
@@ -517,7 +857,7 @@ async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
         )
 
     try:
-        script = NewsScript(**script_dict)
+        script = _build_news_script(script_dict)
     except Exception as e:
         logger.error(f"스크립트 파싱 실패: {e}")
         raise HTTPException(
@@ -526,14 +866,20 @@ async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
         ) from e
 
     try:
-        service = get_audio_service()
-        result = await service.synthesize_speech(
-            script=script,
-            article_id=article_id,
-            user_id=user_id,
+        # 같은 스크립트에 대한 동시 요청은 한 번만 합성
+        # (새 스크립트가 저장된 뒤의 요청은 이전 스크립트의 합성에 합류하지 않음)
+        result = await _run_singleflight(
+            _synthesize_inflight,
+            (user_id, article_id, script_data.get("created_at")),
+            lambda: service.synthesize_speech(
+                script=script,
+                article_id=article_id,
+                user_id=user_id,
+                script_version=script_data.get("created_at"),
+            ),
         )
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
         # 오디오 URL 생성
         audio_url = f"/api/v1/audio/{article_id}.mp3?user_id={user_id}"
@@ -569,6 +915,7 @@ async def synthesize_audio(request: SynthesizeRequest) -> SynthesizeResponse:
 @router.get("/{article_id}.mp3")
 async def get_audio_file(
     article_id: str,
+    storage: StorageServiceDep,
     user_id: str = Query(default=DEFAULT_USER_ID, description="사용자 ID"),
 ):
     """
@@ -581,11 +928,10 @@ async def get_audio_file(
         - Local Storage: FileResponse (MP3 오디오 파일)
         - GCS Storage: RedirectResponse (Signed URL로 302 리다이렉트)
     """
-    storage = get_storage_service()
     audio_path = _get_audio_storage_path(user_id, article_id)
 
-    # 파일 존재 확인
-    if not storage.exists(audio_path):
+    # 파일 존재 확인 (GCS는 HTTP 호출이므로 스레드에서 실행)
+    if not await asyncio.to_thread(storage.exists, audio_path):
         raise HTTPException(
             status_code=404,
             detail=f"오디오 파일을 찾을 수 없습니다: article_id={article_id}, user_id={user_id}",
@@ -601,7 +947,7 @@ async def get_audio_file(
 
     # Local인 경우: FileResponse로 직접 서빙
     local_path = storage.get_local_path(audio_path)
-    if local_path is None or not local_path.exists():
+    if local_path is None or not await asyncio.to_thread(local_path.exists):
         raise HTTPException(
             status_code=404,
             detail=f"오디오 파일을 찾을 수 없습니다: article_id={article_id}, user_id={user_id}",
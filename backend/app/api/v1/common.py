@@ -0,0 +1,64 @@
+"""
+API v1 Common Helpers
+
+여러 라우터(audio, summarize)가 공유하는 SSE 이벤트 인코딩과
+article_id 해시 헬퍼를 제공합니다.
+"""
+
+import hashlib
+
+import orjson
+
+# article_id 해시 초기 상태 (호출마다 copy()하여 생성 비용 절약)
+_ARTICLE_ID_HASH = hashlib.blake2b(digest_size=4)
+
+# SSE 이벤트 prefix (청크마다 인코딩하지 않도록 bytes로 미리 정의)
+EV_THINKING = b"event: thinking\ndata: "
+EV_CONTENT = b"event: content\ndata: "
+EV_TITLE = b"event: title\ndata: "
+EV_PARAGRAPH = b"event: paragraph\ndata: "
+EV_DONE = b"event: done\ndata: "
+EV_ERROR = b"event: error\ndata: "
+SSE_SEP = b"\n\n"
+
+# SSE 응답 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
+}
+
+
+def encode_sse(event_prefix: bytes, payload: dict) -> bytes:
+    """
+    SSE 이벤트 바이트를 생성합니다.
+
+    orjson은 ensure_ascii 없이 UTF-8 bytes로 직렬화하므로 한글이 그대로 전송되며,
+    StreamingResponse가 str → bytes 인코딩을 다시 하지 않습니다.
+
+    Args:
+        event_prefix: 미리 인코딩된 이벤트 prefix (EV_*)
+        payload: 이벤트 데이터
+
+    Returns:
+        SSE 형식 바이트
+    """
+    return event_prefix + orjson.dumps(payload) + SSE_SEP
+
+
+def hash_article_id(hash_input: str, prefix: str) -> str:
+    """
+    해시 입력으로 article_id를 생성합니다.
+
+    Args:
+        hash_input: URL 또는 content 앞부분
+        prefix: article_id 접두사 (예: "script", "summary")
+
+    Returns:
+        생성된 article_id ({prefix}_ + 8자리 hex)
+    """
+    # 보안 용도가 아니므로 MD5 대신 가벼운 BLAKE2b (4바이트 → 8자리 hex)
+    # surrogatepass로 깨진 surrogate가 섞여 있어도 예외 없이 해시
+    hasher = _ARTICLE_ID_HASH.copy()
+    hasher.update(hash_input.encode("utf-8", "surrogatepass"))
+    return f"{prefix}_{hasher.hexdigest()}"
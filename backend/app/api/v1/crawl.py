@@ -17,8 +17,8 @@ Endpoints:
 - TIMEOUT (504): 타임아웃
 """
 
+import hashlib
 import re
-from datetime import datetime
 from urllib.parse import parse_qs, urlparse
 
 import httpx
@@ -38,13 +38,16 @@ from app.services.crawlers import (
     UnsupportedContentError,
     UnsupportedURLError,
 )
-from app.services.storage import get_storage_service
+from app.services.storage import get_storage_service, now_with_path_timestamp
 
 router = APIRouter(prefix="/crawl", tags=["crawl"])
 
 # 기본 사용자 ID (프로토타입용)
 DEFAULT_USER_ID = "default"
 
+# Medium 슬러그 끝의 해시 (예: article-title-abc123def456)
+_MEDIUM_HASH_RE = re.compile(r"-[a-f0-9]{10,}$")
+
 
 # ============================================================================
 # Request Schemas
@@ -87,12 +90,14 @@ def _extract_article_id(url: str, platform: str) -> str:
             slug = path_parts[-1]
             # 슬러그에서 해시 부분 제거 (예: article-title-abc123def456)
             # 마지막 12자리 해시를 제거
-            slug_clean = re.sub(r"-[a-f0-9]{10,}$", "", slug)
+            slug_clean = _MEDIUM_HASH_RE.sub("", slug)
             if slug_clean:
                 return slug_clean[:50]  # 최대 50자
 
     # 기본값: URL 해시
-    return f"article_{abs(hash(url)) % 100000000}"
+    # 내장 hash()는 프로세스마다 시드가 달라 워커 간 ID가 달라지므로 BLAKE2b 사용
+    digest = hashlib.blake2b(url.encode(), digest_size=8).digest()
+    return f"article_{int.from_bytes(digest, 'big') % 100000000}"
 
 
 async def save_crawl_result(
@@ -116,7 +121,7 @@ async def save_crawl_result(
 
         # 파일명 생성
         article_id = _extract_article_id(cleaned.url, cleaned.platform)
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        _, timestamp = now_with_path_timestamp()
         filename = f"{article_id}_{timestamp}.json"
 
         # 저장 경로
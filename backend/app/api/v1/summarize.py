@@ -5,18 +5,29 @@ Summarize API Endpoint
 SSE 스트리밍 엔드포인트 포함.
 """
 
-import hashlib
-import json
 import time
 from collections.abc import AsyncGenerator
-from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from app.services.storage import get_storage_service
+from app.api.v1.common import (
+    EV_CONTENT,
+    EV_DONE,
+    EV_ERROR,
+    EV_THINKING,
+    SSE_HEADERS,
+    encode_sse,
+    hash_article_id,
+)
+from app.services.storage import (
+    encode_json,
+    get_storage_service,
+    now_with_path_timestamp,
+)
 from app.services.summary import SummaryService, get_summary_service
 
 router = APIRouter(prefix="/summarize", tags=["summarize"])
@@ -90,6 +101,23 @@ class SummarizeResponse(BaseModel):
 # ============================================================================
 
 
+@lru_cache(maxsize=1024)
+def _url_article_id(url: str) -> str:
+    """
+    URL 기반 article_id를 반환합니다 (같은 URL은 해시를 다시 계산하지 않음).
+
+    URL 경로의 마지막 조각만으로 ID를 만들면 GeekNews(topic?id=...)처럼
+    경로가 같은 URL끼리 충돌하므로 해시는 유지하고 결과를 캐시합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        생성된 article_id
+    """
+    return hash_article_id(url, "summary")
+
+
 def _generate_article_id(url: str | None, content: str) -> str:
     """
     URL 또는 content 해시 기반으로 article_id를 생성합니다.
@@ -102,14 +130,10 @@ def _generate_article_id(url: str | None, content: str) -> str:
         생성된 article_id
     """
     if url:
-        # URL 기반 해시 (앞 8자리)
-        hash_input = url
-    else:
-        # content 기반 해시 (앞 8자리)
-        hash_input = content[:500]  # 앞 500자만 사용
+        return _url_article_id(url)
 
-    hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:8]
-    return f"summary_{hash_value}"
+    # content 기반 해시 (앞 500자만 사용)
+    return hash_article_id(content[:500], "summary")
 
 
 async def _save_summary_result(
@@ -135,8 +159,8 @@ async def _save_summary_result(
     try:
         storage = get_storage_service()
 
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        # 파일명 생성 (시각은 한 번만 조회하여 created_at과 공유)
+        now, timestamp = now_with_path_timestamp()
         filename = f"{article_id}_{timestamp}.json"
 
         # 저장 경로
@@ -147,12 +171,14 @@ async def _save_summary_result(
             "user_id": user_id,
             "article_id": article_id,
             "url": url,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             **result,
         }
 
-        # JSON 저장
-        saved_path = await storage.save_json(path, save_data)
+        # JSON 저장 (orjson으로 직렬화한 bytes를 그대로 업로드)
+        saved_path = await storage.save_bytes(
+            path, encode_json(save_data), content_type="application/json"
+        )
 
         logger.info(f"요약 결과 저장됨: {saved_path}")
         return saved_path
@@ -183,13 +209,9 @@ async def summarize_content(request: SummarizeRequest) -> SummarizeResponse:
     Returns:
         요약 결과 (bullet_points, main_topic, model, processing_time_ms, article_id, saved_path)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
-    # user_id 및 article_id 결정
     user_id = request.user_id or DEFAULT_USER_ID
-    article_id = request.article_id or _generate_article_id(
-        request.url, request.content
-    )
 
     try:
         service = get_summary_service()
@@ -198,7 +220,12 @@ async def summarize_content(request: SummarizeRequest) -> SummarizeResponse:
             original_content=request.original_content,
         )
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+
+        # article_id는 저장 직전에 결정 (요약 실패 시 해시 생략)
+        article_id = request.article_id or _generate_article_id(
+            request.url, request.content
+        )
 
         # 요약 결과 저장
         result_dict = {
@@ -260,7 +287,7 @@ class StreamEvent(BaseModel):
 
 async def _generate_sse_events(
     request: SummarizeRequest,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     SSE 이벤트를 생성합니다.
 
@@ -270,13 +297,9 @@ async def _generate_sse_events(
     - done: 완료 및 최종 결과 JSON
     - error: 에러 발생
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
-    # user_id 및 article_id 결정
     user_id = request.user_id or DEFAULT_USER_ID
-    article_id = request.article_id or _generate_article_id(
-        request.url, request.content
-    )
 
     full_thinking = ""
     full_content = ""
@@ -288,22 +311,24 @@ async def _generate_sse_events(
             content=request.content,
             original_content=request.original_content,
         ):
-            # 이벤트 데이터 구성
-            event_data = json.dumps({"text": text}, ensure_ascii=False)
-
             if event_type == "thinking":
                 full_thinking += text
-                yield f"event: thinking\ndata: {event_data}\n\n"
+                yield encode_sse(EV_THINKING, {"text": text})
             elif event_type == "content":
                 full_content += text
-                yield f"event: content\ndata: {event_data}\n\n"
+                yield encode_sse(EV_CONTENT, {"text": text})
 
         # 스트리밍 완료 후 결과 파싱
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
         # Plain Text를 SummaryResult로 파싱
         result = SummaryService.parse_stream_result(full_content)
 
+        # article_id는 저장 직전에 결정 (요약 실패 시 해시 생략)
+        article_id = request.article_id or _generate_article_id(
+            request.url, request.content
+        )
+
         # 결과 저장
         result_dict = {
             "bullet_points": result.bullet_points,
@@ -319,20 +344,12 @@ async def _generate_sse_events(
             url=request.url,
         )
 
-        # 최종 결과 이벤트
-        done_data = json.dumps(
-            {
-                "bullet_points": result.bullet_points,
-                "main_topic": result.main_topic,
-                "model": service.model_name,
-                "processing_time_ms": processing_time_ms,
-                "article_id": article_id,
-                "saved_path": str(saved_path) if saved_path else None,
-            },
-            ensure_ascii=False,
-        )
-
-        yield f"event: done\ndata: {done_data}\n\n"
+        # 최종 결과 이벤트 (저장용 result_dict를 재사용, thinking은 제외)
+        # _save_summary_result는 result를 복사해 저장하므로 그대로 수정해도 안전
+        result_dict.pop("thinking")
+        result_dict["article_id"] = article_id
+        result_dict["saved_path"] = str(saved_path) if saved_path else None
+        yield encode_sse(EV_DONE, result_dict)
 
         logger.info(
             f"스트리밍 요약 API 완료: {len(result.bullet_points)}개 포인트, "
@@ -340,15 +357,13 @@ async def _generate_sse_events(
         )
 
     except ValueError as e:
-        error_data = json.dumps({"error": str(e)}, ensure_ascii=False)
-        yield f"event: error\ndata: {error_data}\n\n"
+        yield encode_sse(EV_ERROR, {"error": str(e)})
         logger.warning(f"스트리밍 요약 요청 오류: {e}")
 
     except Exception as e:
-        error_data = json.dumps(
-            {"error": f"요약 처리 중 오류가 발생했습니다: {str(e)}"}, ensure_ascii=False
+        yield encode_sse(
+            EV_ERROR, {"error": f"요약 처리 중 오류가 발생했습니다: {str(e)}"}
         )
-        yield f"event: error\ndata: {error_data}\n\n"
         logger.error(f"스트리밍 요약 처리 실패: {e}")
 
 
@@ -381,9 +396,5 @@ async def summarize_stream(request: SummarizeRequest) -> StreamingResponse:
     return StreamingResponse(
         _generate_sse_events(request),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
-        },
+        headers=SSE_HEADERS,
     )
@@ -1,8 +1,12 @@
-import json
+import re
 
-from pydantic import AnyHttpUrl, validator
+import orjson
+from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 콤마 구분 문자열 분리 (구분자 주변 공백까지 함께 제거)
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
 
 class Settings(BaseSettings):
     PROJECT_NAME: str
@@ -29,12 +33,22 @@ class Settings(BaseSettings):
     AUDIO_SCRIPT_THINKING_BUDGET: int = 2048
     AUDIO_SCRIPT_INCLUDE_THOUGHTS: bool = False
     AUDIO_SCRIPT_TEMPERATURE: float = 0.5  # 대본 생성은 약간의 창의성 허용
+    # 동일 콘텐츠 재요청 시 LLM 호출을 생략하는 스크립트 캐시 (0이면 비활성화)
+    AUDIO_SCRIPT_CACHE_MAXSIZE: int = 256
+    AUDIO_SCRIPT_CACHE_TTL_SEC: int = 3600
 
     # ===== OpenAI TTS (음성 합성) 설정 =====
     OPENAI_API_KEY: str = ""  # OpenAI API 키 (openai SDK가 자동으로 사용)
     TTS_MODEL: str = "gpt-4o-mini-tts"
     TTS_VOICE: str = "marin"  # marin, cedar 권장 (최고 품질)
     TTS_SILENCE_PADDING_MS: int = 500  # 문단 사이 silence 길이 (ms)
+    TTS_MAX_CONCURRENCY: int = 6  # 동시에 진행할 문단 TTS 요청 수 (429 방지)
+    # 문단 TTS 결과 캐시 (storage의 cache/tts/ 아래에 저장, 같은 문단 재합성 생략)
+    TTS_PARAGRAPH_CACHE_ENABLED: bool = True
+    # 로컬 스토리지 캐시 한도: 보관 기간(일)과 전체 크기(바이트), 0이면 제한 없음
+    # GCS는 버킷 lifecycle 규칙(prefix cache/tts/, age)으로 만료시킴
+    TTS_PARAGRAPH_CACHE_MAX_AGE_DAYS: int = 30
+    TTS_PARAGRAPH_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
     TTS_INSTRUCTIONS: str = "차분하고 전문적인 한국어 뉴스 아나운서 톤으로 읽어주세요. 명확한 발음과 적절한 속도로 진행합니다."
 
     # ===== Apidog 설정 (CI/CD 연동용) =====
@@ -56,17 +70,18 @@ class Settings(BaseSettings):
     # GCS Signed URL 만료 시간 (분)
     GCS_SIGNED_URL_EXPIRY_MINUTES: int = 60
 
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | list[str]) -> list[str] | str:
         if isinstance(v, str):
             # JSON 배열 형태인 경우 파싱
             if v.startswith("["):
                 try:
-                    return json.loads(v)
-                except json.JSONDecodeError:
+                    return orjson.loads(v)
+                except orjson.JSONDecodeError:
                     pass
             # 콤마로 구분된 문자열인 경우
-            return [i.strip() for i in v.split(",")]
+            return _CSV_SPLIT.split(v.strip())
         elif isinstance(v, list):
             return v
         raise ValueError(v)
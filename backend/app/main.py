@@ -1,30 +1,53 @@
-import json
-
 # 디버그 모드 (환경변수로 제어, 기본값: False)
 import os
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1 import audio, crawl, summarize
 from app.core.config import settings
 from app.core.tracing import init_tracing
+from app.services.audio import close_audio_service
+from app.services.crawlers.base import close_http_transport
 
 DEBUG_MODE = os.getenv("DEBUG_CORS", "false").lower() == "true"
 DEBUG_LOG_PATH = Path(os.getenv("DEBUG_LOG_PATH", "/tmp/debug.log"))
 
-
-def debug_log(hypothesis_id: str, location: str, message: str, data: dict):
-    """디버그 로그를 NDJSON 형식으로 파일에 기록 (DEBUG_MODE일 때만)"""
-    if not DEBUG_MODE:
-        return
-    import time
-
+# 디버그 로그 라인 큐 (백그라운드 writer 스레드가 모아서 기록)
+_debug_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+
+
+def _debug_writer() -> None:
+    """큐에 쌓인 디버그 로그를 한 번의 write로 모아서 기록합니다."""
+    while True:
+        # 첫 라인을 기다린 뒤 그동안 쌓인 라인을 모두 꺼내 일괄 기록
+        lines = [_debug_queue.get()]
+        while True:
+            try:
+                lines.append(_debug_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with open(DEBUG_LOG_PATH, "ab") as f:
+                f.write(b"".join(lines))
+        except Exception:
+            pass  # 프로덕션에서 로깅 실패해도 앱은 계속 동작
+
+
+def _debug_log(hypothesis_id: str, location: str, message: str, data: dict) -> None:
+    """디버그 로그를 NDJSON 형식으로 파일에 기록"""
     log_entry = {
         "timestamp": int(time.time() * 1000),
         "sessionId": "debug-session",
@@ -34,51 +57,82 @@ def debug_log(hypothesis_id: str, location: str, message: str, data: dict):
         "message": message,
         "data": data,
     }
-    try:
-        with open(DEBUG_LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-    except Exception:
-        pass  # 프로덕션에서 로깅 실패해도 앱은 계속 동작
+    # 파일 I/O는 writer 스레드에서 수행 (이벤트 루프 블로킹 방지)
+    _debug_queue.put_nowait(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
 
 
-class DebugCORSMiddleware(BaseHTTPMiddleware):
-    """CORS 요청을 디버깅하기 위한 미들웨어 (DEBUG_MODE일 때만 로깅)"""
+def _debug_log_disabled(
+    hypothesis_id: str, location: str, message: str, data: dict
+) -> None:
+    """DEBUG_MODE가 아닐 때 사용하는 no-op"""
 
-    async def dispatch(self, request: Request, call_next):
-        if DEBUG_MODE:
-            origin = request.headers.get("origin", "NO_ORIGIN")
-            method = request.method
-            path = request.url.path
 
-            debug_log(
-                "D",
-                "main.py:DebugCORSMiddleware",
-                "Request received",
-                {
-                    "method": method,
-                    "path": path,
-                    "origin": origin,
-                    "is_options": method == "OPTIONS",
-                },
-            )
+# DEBUG_MODE는 import 시점에 결정되므로 호출마다 확인하지 않고 구현을 선택
+if DEBUG_MODE:
+    debug_log = _debug_log
+    threading.Thread(target=_debug_writer, name="debug-log-writer", daemon=True).start()
+else:
+    debug_log = _debug_log_disabled
 
-        response = await call_next(request)
 
-        if DEBUG_MODE:
-            origin = request.headers.get("origin", "NO_ORIGIN")
-            cors_header = response.headers.get("access-control-allow-origin", "NOT_SET")
-            debug_log(
-                "D",
-                "main.py:DebugCORSMiddleware:response",
-                "Response headers",
-                {
-                    "status_code": response.status_code,
-                    "cors_header": cors_header,
-                    "origin_requested": origin,
-                },
-            )
+class DebugCORSMiddleware:
+    """
+    CORS 요청을 디버깅하기 위한 순수 ASGI 미들웨어 (DEBUG_MODE일 때만 로깅)
+
+    BaseHTTPMiddleware와 달리 요청마다 Task/메모리 스트림을 만들지 않고,
+    send를 감싸 응답 시작 메시지의 헤더만 확인하므로 SSE 청크가 그대로 흐릅니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not DEBUG_MODE:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        origin = headers.get("origin", "NO_ORIGIN")
+        method = scope["method"]
+
+        debug_log(
+            "D",
+            "main.py:DebugCORSMiddleware",
+            "Request received",
+            {
+                "method": method,
+                "path": scope["path"],
+                "origin": origin,
+                "is_options": method == "OPTIONS",
+            },
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = Headers(raw=message.get("headers", []))
+                debug_log(
+                    "D",
+                    "main.py:DebugCORSMiddleware:response",
+                    "Response headers",
+                    {
+                        "status_code": message["status"],
+                        "cors_header": response_headers.get(
+                            "access-control-allow-origin", "NOT_SET"
+                        ),
+                        "origin_requested": origin,
+                    },
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """앱 수명 주기: 종료 시 외부 API HTTP 커넥션을 정리합니다."""
+    yield
+    await close_audio_service()
+    await close_http_transport()
 
 
 def get_application() -> FastAPI:
@@ -109,6 +163,7 @@ URL 크롤링, AI 요약, 뉴스 스크립트 생성 및 TTS 음성 합성을 
 
 현재 버전은 인증 없이 사용 가능합니다.
         """,
+        lifespan=lifespan,
         openapi_url=None,  # 커스텀 엔드포인트 사용
         docs_url="/docs",
         redoc_url="/redoc",
@@ -191,8 +246,9 @@ URL 크롤링, AI 요약, 뉴스 스크립트 생성 및 TTS 음성 합성을 
     else:
         logger.warning("CORS origins가 설정되지 않음 - CORS 미들웨어 비활성화")
 
-    # 디버그 미들웨어 (DEBUG_MODE일 때만 유용하지만 항상 추가 - 오버헤드 최소)
-    _app.add_middleware(DebugCORSMiddleware)
+    # 디버그 미들웨어 (DEBUG_MODE일 때만 추가)
+    if DEBUG_MODE:
+        _app.add_middleware(DebugCORSMiddleware)
 
     # API v1 라우터 등록
     _app.include_router(crawl.router, prefix=settings.API_V1_STR)
@@ -221,7 +277,7 @@ async def custom_openapi():
     """
     openapi_schema = app.openapi()
     return Response(
-        content=json.dumps(openapi_schema, ensure_ascii=False, indent=2),
+        content=orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2),
         media_type="application/json; charset=utf-8",
     )
 
@@ -245,4 +301,11 @@ async def health_check():
 
 # 디버깅 용: python app/main.py로 실행 시
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+    )
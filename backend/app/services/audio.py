@@ -10,28 +10,48 @@ Step 2: TTS 음성 합성 (OpenAI gpt-4o-mini-tts)
 """
 
 import asyncio
-import io
+import hashlib
 import os
 import re
+import threading
+import time
+from collections import deque
 from collections.abc import AsyncGenerator
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import httpx
+from cachetools import TTLCache
 from google.oauth2 import service_account
 from langchain_core.messages import AIMessageChunk
 from langchain_google_genai import ChatGoogleGenerativeAI
 from loguru import logger
-from openai import AsyncOpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
 from pydub import AudioSegment
 from tenacity import (
     RetryError,
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from app.core.config import settings
+from app.services.llm_utils import (
+    BLOCK_DISPATCH,
+    MERGE_CONTENT_HEADER,
+    MERGE_ORIGINAL_HEADER,
+    is_retryable_llm_error,
+)
 from app.services.prompt_loader import format_prompt
 from output_schemas.audio import NewsScript
 
@@ -48,11 +68,40 @@ MAX_RETRY_ATTEMPTS = 3
 RETRY_MIN_WAIT = 2  # 최소 대기 시간 (초)
 RETRY_MAX_WAIT = 10  # 최대 대기 시간 (초)
 
+# TTS 재시도 대상: 일시적 오류만 (4xx 요청 오류는 재시도해도 같은 결과)
+# APIConnectionError는 APITimeoutError를 포함
+TTS_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+# OpenAI TTS의 response_format="pcm" 출력 포맷 (24kHz, 16-bit signed LE, mono)
+TTS_PCM_FRAME_RATE = 24000
+TTS_PCM_SAMPLE_WIDTH = 2
+TTS_PCM_CHANNELS = 1
+TTS_PCM_FRAME_WIDTH = TTS_PCM_SAMPLE_WIDTH * TTS_PCM_CHANNELS
+
+# 문단 TTS 캐시 디렉토리 (storage 기준 상대 경로)
+TTS_CACHE_DIR = "cache/tts"
+# 로컬 문단 TTS 캐시 정리 최소 간격 (초)
+TTS_CACHE_PRUNE_INTERVAL_SEC = 3600
+
+# OpenAI HTTP 커넥션 풀 설정
+# keepalive 연결을 TTS 동시 요청 수보다 넉넉히 유지해 문단마다 TLS 핸드셰이크를 피함
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+# SDK 기본값(600초) 대신 TTS 한 문단에 맞는 타임아웃 (연결은 빠르게 실패)
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# 스트리밍 스크립트 파싱용 정규식 (호출마다 컴파일하지 않도록 미리 컴파일)
+_TITLE_RE = re.compile(r"\[제목\]\s*\n(.+?)(?:\n\n|\n\[|$)", re.DOTALL)
+_SCRIPT_RE = re.compile(r"\[스크립트\]\s*\n([\s\S]*?)$", re.DOTALL)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+
 
+@lru_cache(maxsize=1)
 def _get_credentials() -> service_account.Credentials | None:
     """
     서비스 계정 자격 증명을 가져옵니다.
 
+    키 파일 읽기/파싱은 프로세스당 한 번만 수행하고 결과를 재사용합니다.
+
     환경변수 GOOGLE_APPLICATION_CREDENTIALS가 설정되어 있으면 해당 파일에서,
     없으면 기본 위치(~/readforme-key.json)에서 자격 증명을 로드합니다.
 
@@ -96,6 +145,56 @@ def _log_retry(retry_state) -> None:
     )
 
 
+def _prune_cache_dir(cache_dir: Path, max_age_sec: float, max_bytes: int) -> int:
+    """
+    로컬 캐시 디렉토리에서 오래된 파일을 삭제합니다 (워커 스레드에서 실행).
+
+    max_age_sec보다 오래된 파일을 먼저 지우고, 남은 파일의 합계가
+    max_bytes를 넘으면 오래된 순으로 한도 아래가 될 때까지 지웁니다.
+
+    Args:
+        cache_dir: 정리할 디렉토리
+        max_age_sec: 최대 보관 기간 (초, 0이면 제한 없음)
+        max_bytes: 전체 크기 한도 (바이트, 0이면 제한 없음)
+
+    Returns:
+        삭제한 파일 수
+    """
+    if not cache_dir.is_dir():
+        return 0
+
+    now = time.time()
+    removed = 0
+    entries: list[tuple[float, int, str]] = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            if max_age_sec and now - stat.st_mtime > max_age_sec:
+                Path(entry.path).unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    if max_bytes:
+        total = sum(size for _, size, _ in entries)
+        if total > max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= max_bytes:
+                    break
+                Path(path).unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+    return removed
+
+
 class AudioService:
     """뉴스 스크립트 생성 서비스"""
 
@@ -136,6 +235,8 @@ class AudioService:
 
         # ChatGoogleGenerativeAI 사용
         # credentials 또는 project 파라미터가 있으면 자동으로 Vertex AI 백엔드 사용
+        # Streaming(Plain Text)도 같은 설정이므로 이 인스턴스를 그대로 사용
+        # thinking_budget > 0 이고 include_thoughts=True 이면 thinking 블록도 스트리밍됨
         self.llm = ChatGoogleGenerativeAI(
             model=self.model_name,
             credentials=credentials,
@@ -148,17 +249,17 @@ class AudioService:
         # Structured Output 적용
         self.llm_structured = self.llm.with_structured_output(NewsScript)
 
-        # Streaming용 LLM (Thinking 기능 활성화, Plain Text 출력)
-        # thinking_budget > 0 이면 AI의 추론 과정을 스트리밍으로 받을 수 있음
-        # include_thoughts=True 설정이 있어야 thinking 블록이 응답에 포함됨
-        self.llm_streaming = ChatGoogleGenerativeAI(
-            model=self.model_name,
-            credentials=credentials,
-            project=self.project_id,
-            temperature=self.temperature,
-            thinking_budget=self.thinking_budget,
-            include_thoughts=self.include_thoughts,
+        # 생성된 스크립트 캐시 (정규화한 병합 콘텐츠 해시 → NewsScript)
+        # generate_script_sync는 스레드에서 호출될 수 있으므로 lock으로 보호
+        self._script_cache: TTLCache | None = (
+            TTLCache(
+                maxsize=settings.AUDIO_SCRIPT_CACHE_MAXSIZE,
+                ttl=settings.AUDIO_SCRIPT_CACHE_TTL_SEC,
+            )
+            if settings.AUDIO_SCRIPT_CACHE_MAXSIZE > 0
+            else None
         )
+        self._script_cache_lock = threading.Lock()
 
         # ===== OpenAI TTS 설정 =====
         self.tts_model = settings.TTS_MODEL
@@ -166,9 +267,33 @@ class AudioService:
         self.tts_silence_padding_ms = settings.TTS_SILENCE_PADDING_MS
         self.tts_instructions = settings.TTS_INSTRUCTIONS
 
+        # 문단마다 동일한 TTS 요청 파라미터 (호출마다 다시 만들지 않음)
+        # response_format은 TTS_PCM_* 포맷과 맞춰야 함
+        self._tts_request_params = {
+            "model": self.tts_model,
+            "voice": self.tts_voice,
+            "instructions": self.tts_instructions,
+            "response_format": "pcm",
+        }
+
+        # 문단 TTS 동시 요청 수 제한 (긴 스크립트가 한 번에 몰려 429가 나지 않도록)
+        self._tts_semaphore = asyncio.Semaphore(settings.TTS_MAX_CONCURRENCY)
+
+        # 로컬 문단 TTS 캐시 정리 상태 (마지막 정리 시각, 진행 중인 정리 Task)
+        self._tts_cache_pruned_at: float | None = None
+        self._tts_cache_prune_task: asyncio.Task | None = None
+
         # OpenAI 클라이언트 (비동기)
         # settings에서 API 키를 명시적으로 전달 (pydantic-settings가 .env에서 로드)
-        self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # 재시도는 _call_openai_tts의 tenacity가 담당하므로 SDK 자체 재시도는 끔
+        # HTTP 클라이언트는 서비스 수명 동안 재사용 (종료 시 aclose()로 정리)
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(
+                limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT
+            ),
+        )
 
         logger.info(
             f"AudioService 초기화 완료: model={self.model_name}, "
@@ -178,6 +303,10 @@ class AudioService:
             f"tts_model={self.tts_model}, tts_voice={self.tts_voice}"
         )
 
+    async def aclose(self) -> None:
+        """OpenAI HTTP 커넥션 풀을 닫습니다 (앱 종료 시 호출)."""
+        await self.openai_client.close()
+
     def _merge_content(
         self,
         content: str,
@@ -196,24 +325,78 @@ class AudioService:
         Returns:
             병합된 콘텐츠 문자열
         """
-        if not original_content or not original_content.strip():
+        if not original_content:
+            return content
+
+        # strip은 한 번만 (앞뒤 공백이 없으면 CPython은 복사 없이 원본을 반환)
+        original_stripped = original_content.strip()
+        if not original_stripped:
             return content
 
         # 두 소스를 구분하여 병합
-        merged = f"""## GeekNews 요약/코멘트
+        return "".join(
+            (
+                MERGE_CONTENT_HEADER,
+                content.strip(),
+                MERGE_ORIGINAL_HEADER,
+                original_stripped,
+            )
+        )
 
-{content.strip()}
+    @staticmethod
+    def _script_cache_key(merged_content: str) -> bytes:
+        """
+        스크립트 캐시 키를 생성합니다.
 
-## 원본 아티클
+        공백 차이만 있는 콘텐츠는 같은 키가 되도록 공백을 정규화한 뒤 해시합니다.
 
-{original_content.strip()}"""
+        Args:
+            merged_content: 병합된 콘텐츠
 
-        return merged
+        Returns:
+            캐시 키 (16바이트 BLAKE2b digest)
+        """
+        normalized = " ".join(merged_content.split())
+        return hashlib.blake2b(
+            normalized.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def _get_cached_script(self, key: bytes) -> NewsScript | None:
+        """
+        캐시된 스크립트의 복사본을 반환합니다 (없으면 None).
+
+        Args:
+            key: _script_cache_key로 만든 캐시 키
+
+        Returns:
+            NewsScript 복사본 또는 None
+        """
+        if self._script_cache is None:
+            return None
+        with self._script_cache_lock:
+            cached = self._script_cache.get(key)
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    def _set_cached_script(self, key: bytes, script: NewsScript) -> None:
+        """
+        생성된 스크립트를 캐시에 저장합니다.
+
+        Args:
+            key: _script_cache_key로 만든 캐시 키
+            script: 생성된 스크립트
+        """
+        if self._script_cache is None:
+            return
+        with self._script_cache_lock:
+            self._script_cache[key] = script.model_copy(deep=True)
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(
+            multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception(is_retryable_llm_error),
         before_sleep=_log_retry,
         reraise=True,
     )
@@ -257,6 +440,13 @@ class AudioService:
         # 콘텐츠 병합 (original_content가 있으면)
         merged_content = self._merge_content(content, original_content)
 
+        # 같은 콘텐츠로 생성한 스크립트가 있으면 LLM 호출 생략
+        cache_key = self._script_cache_key(merged_content)
+        cached = self._get_cached_script(cache_key)
+        if cached is not None:
+            logger.info(f"스크립트 캐시 히트: {len(cached.paragraphs)}개 문단")
+            return cached
+
         # 프롬프트 생성
         prompt = format_prompt(
             version=self.prompt_version,
@@ -276,6 +466,7 @@ class AudioService:
         # LLM 호출 (비동기, 재시도 로직 포함)
         try:
             result = await self._invoke_llm(prompt)
+            self._set_cached_script(cache_key, result)
             logger.info(
                 f"스크립트 생성 완료: {len(result.paragraphs)}개 문단, "
                 f"총 {result.total_characters}자, "
@@ -294,8 +485,10 @@ class AudioService:
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(
+            multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception(is_retryable_llm_error),
         before_sleep=_log_retry,
         reraise=True,
     )
@@ -326,6 +519,13 @@ class AudioService:
         # 콘텐츠 병합 (original_content가 있으면)
         merged_content = self._merge_content(content, original_content)
 
+        # 같은 콘텐츠로 생성한 스크립트가 있으면 LLM 호출 생략
+        cache_key = self._script_cache_key(merged_content)
+        cached = self._get_cached_script(cache_key)
+        if cached is not None:
+            logger.info(f"스크립트 캐시 히트 (동기): {len(cached.paragraphs)}개 문단")
+            return cached
+
         prompt = format_prompt(
             version=self.prompt_version,
             name="news_script",
@@ -343,6 +543,7 @@ class AudioService:
 
         try:
             result = self._invoke_llm_sync(prompt)
+            self._set_cached_script(cache_key, result)
             logger.info(
                 f"스크립트 생성 완료: {len(result.paragraphs)}개 문단, "
                 f"총 {result.total_characters}자, "
@@ -398,35 +599,28 @@ class AudioService:
         )
 
         try:
-            async for chunk in self.llm_streaming.astream(prompt):
+            async for chunk in self.llm.astream(prompt):
                 if not isinstance(chunk, AIMessageChunk):
                     continue
 
-                # content가 list인 경우 (thinking + text 블록)
-                if isinstance(chunk.content, list):
-                    for block in chunk.content:
-                        if isinstance(block, dict):
-                            block_type = block.get("type", "")
-                            # Thinking 블록
-                            if block_type == "thinking":
-                                thinking_text = block.get("thinking", "")
-                                if thinking_text:
-                                    yield ("thinking", thinking_text)
-                            # Reasoning 블록 (output_version에 따라 다름)
-                            elif block_type == "reasoning":
-                                reasoning_text = block.get("reasoning", "")
-                                if reasoning_text:
-                                    yield ("thinking", reasoning_text)
-                            # Text 블록
-                            elif block_type == "text":
-                                text = block.get("text", "")
-                                if text:
-                                    yield ("content", text)
-                        elif isinstance(block, str) and block:
-                            yield ("content", block)
+                chunk_content = chunk.content
                 # content가 문자열인 경우
-                elif isinstance(chunk.content, str) and chunk.content:
-                    yield ("content", chunk.content)
+                if isinstance(chunk_content, str):
+                    if chunk_content:
+                        yield ("content", chunk_content)
+                    continue
+
+                # content가 list인 경우 (thinking + text 블록)
+                for block in chunk_content:
+                    if isinstance(block, dict):
+                        dispatch = BLOCK_DISPATCH.get(block.get("type"))
+                        if dispatch is not None:
+                            event_type, text_key = dispatch
+                            text = block.get(text_key)
+                            if text:
+                                yield (event_type, text)
+                    elif isinstance(block, str) and block:
+                        yield ("content", block)
 
         except Exception as e:
             logger.error(f"스트리밍 스크립트 생성 실패: {e}")
@@ -456,40 +650,69 @@ class AudioService:
         Returns:
             NewsScript: 파싱된 뉴스 스크립트 결과
         """
-        title = ""
         paragraphs: list[str] = []
 
-        # [제목] 파싱
-        title_match = re.search(
-            r"\[제목\]\s*\n(.+?)(?:\n\n|\n\[|$)", full_content, re.DOTALL
-        )
-        if title_match:
-            title = title_match.group(1).strip()
-
         # [스크립트] 파싱 - 빈 줄로 구분된 문단 추출
-        script_match = re.search(
-            r"\[스크립트\]\s*\n([\s\S]*?)$", full_content, re.DOTALL
-        )
+        script_match = _SCRIPT_RE.search(full_content)
         if script_match:
             script_text = script_match.group(1).strip()
             # 빈 줄로 문단 분리 (연속된 빈 줄도 하나로 처리)
-            raw_paragraphs = re.split(r"\n\n+", script_text)
+            raw_paragraphs = _PARAGRAPH_SPLIT_RE.split(script_text)
             for p in raw_paragraphs:
                 p = p.strip()
                 if p:
                     paragraphs.append(p)
 
+        # 파싱 실패 시 fallback
+        if not paragraphs:
+            # 전체 내용을 하나의 문단으로 사용
+            paragraphs = [full_content.strip()[:500]]
+
+        return AudioService.build_stream_script(
+            AudioService.parse_stream_title(full_content), paragraphs
+        )
+
+    @staticmethod
+    def parse_stream_title(text: str) -> str:
+        """
+        스트리밍 텍스트의 [제목] 섹션에서 제목을 추출합니다.
+
+        [제목] 섹션이 없으면 첫 번째 줄을 제목으로 사용합니다.
+
+        Args:
+            text: [스크립트] 섹션 이전까지를 포함하는 스트리밍 텍스트
+
+        Returns:
+            제목 (없으면 빈 문자열)
+        """
+        title = ""
+
+        # [제목] 파싱
+        title_match = _TITLE_RE.search(text)
+        if title_match:
+            title = title_match.group(1).strip()
+
         # 파싱 실패 시 fallback
         if not title:
             # 첫 번째 줄을 제목으로 사용
-            lines = full_content.strip().split("\n")
+            lines = text.strip().split("\n")
             if lines:
                 title = lines[0].strip()[:50]  # 최대 50자
 
-        if not paragraphs:
-            # 전체 내용을 하나의 문단으로 사용
-            paragraphs = [full_content.strip()[:500]]
+        return title
 
+    @staticmethod
+    def build_stream_script(title: str, paragraphs: list[str]) -> NewsScript:
+        """
+        파싱된 제목과 문단으로 NewsScript를 생성합니다.
+
+        Args:
+            title: 제목
+            paragraphs: 문단 리스트
+
+        Returns:
+            NewsScript: 글자 수/예상 시간이 계산된 뉴스 스크립트
+        """
         # 총 글자 수 계산
         total_characters = sum(len(p) for p in paragraphs)
 
@@ -514,8 +737,10 @@ class AudioService:
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(
+            multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception_type(TTS_RETRYABLE_ERRORS),
         before_sleep=_log_retry,
         reraise=True,
     )
@@ -523,62 +748,223 @@ class AudioService:
         """
         단일 텍스트를 OpenAI TTS API로 음성 합성합니다.
 
+        동시 요청 수는 TTS_MAX_CONCURRENCY로 제한되며, 재시도 대기 중에는
+        슬롯을 반납합니다. 연결/429/5xx 오류만 재시도합니다.
+
         Args:
             text: 음성으로 변환할 텍스트
 
         Returns:
-            MP3 오디오 바이트 데이터
-        """
-        async with self.openai_client.audio.speech.with_streaming_response.create(
-            model=self.tts_model,
-            voice=self.tts_voice,
-            input=text,
-            instructions=self.tts_instructions,
-            response_format="mp3",
-        ) as response:
+            PCM 오디오 바이트 데이터 (24kHz, 16-bit signed LE, mono)
+        """
+        async with (
+            self._tts_semaphore,
+            self.openai_client.audio.speech.with_streaming_response.create(
+                input=text, **self._tts_request_params
+            ) as response,
+        ):
             audio_bytes = await response.read()
 
         return audio_bytes
 
-    def _merge_audio_chunks(
+    def _tts_cache_path(self, text: str) -> str:
+        """
+        문단 TTS 캐시의 스토리지 경로를 생성합니다.
+
+        음성/모델/지시문/출력 포맷이 같고 문단 텍스트가 같으면 같은 경로가 됩니다.
+
+        Args:
+            text: 문단 텍스트
+
+        Returns:
+            스토리지 경로 (예: cache/tts/{hash}.pcm)
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (self.tts_voice, self.tts_model, self.tts_instructions, text):
+            hasher.update(part.encode("utf-8", "surrogatepass"))
+            hasher.update(b"\x00")
+        return f"{TTS_CACHE_DIR}/{hasher.hexdigest()}.pcm"
+
+    def _schedule_tts_cache_prune(self, storage: "StorageService") -> None:
+        """
+        로컬 문단 TTS 캐시 정리를 백그라운드로 시작합니다.
+
+        TTS_CACHE_PRUNE_INTERVAL_SEC마다 한 번만 실행하며, 디렉토리 스캔은
+        스레드에서 수행합니다. GCS는 로컬 경로가 없으므로 버킷 lifecycle 규칙에
+        맡기고 정리하지 않습니다.
+
+        Args:
+            storage: 캐시가 저장된 StorageService
+        """
+        max_age_sec = settings.TTS_PARAGRAPH_CACHE_MAX_AGE_DAYS * 86400
+        max_bytes = settings.TTS_PARAGRAPH_CACHE_MAX_BYTES
+        if not max_age_sec and not max_bytes:
+            return
+
+        cache_dir = storage.get_local_path(TTS_CACHE_DIR)
+        if cache_dir is None:
+            return
+
+        now = time.monotonic()
+        if (
+            self._tts_cache_pruned_at is not None
+            and now - self._tts_cache_pruned_at < TTS_CACHE_PRUNE_INTERVAL_SEC
+        ):
+            return
+        if self._tts_cache_prune_task is not None:
+            return
+        self._tts_cache_pruned_at = now
+
+        async def prune() -> None:
+            try:
+                removed = await asyncio.to_thread(
+                    _prune_cache_dir, cache_dir, max_age_sec, max_bytes
+                )
+                if removed:
+                    logger.info(f"TTS 캐시 정리: {removed}개 파일 삭제 ({cache_dir})")
+            except Exception as e:
+                logger.warning(f"TTS 캐시 정리 실패: {cache_dir}, error={e}")
+            finally:
+                self._tts_cache_prune_task = None
+
+        self._tts_cache_prune_task = asyncio.create_task(prune())
+
+    async def _synthesize_paragraph(
+        self, text: str, storage: "StorageService"
+    ) -> bytes:
+        """
+        문단 하나를 합성합니다 (캐시에 있으면 TTS 호출 생략).
+
+        캐시 조회/저장 실패는 합성 결과에 영향을 주지 않도록 로그만 남깁니다.
+
+        Args:
+            text: 음성으로 변환할 문단 텍스트
+            storage: 캐시를 저장할 StorageService
+
+        Returns:
+            PCM 오디오 바이트 데이터
+        """
+        if not settings.TTS_PARAGRAPH_CACHE_ENABLED:
+            return await self._call_openai_tts(text)
+
+        cache_path = self._tts_cache_path(text)
+        try:
+            cached = await storage.load_bytes(cache_path)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 조회 실패: {cache_path}, error={e}")
+            cached = None
+        if cached:
+            logger.debug(f"TTS 캐시 히트: {cache_path}")
+            return cached
+
+        audio_bytes = await self._call_openai_tts(text)
+
+        try:
+            await storage.save_bytes(
+                cache_path, audio_bytes, content_type="application/octet-stream"
+            )
+        except Exception as e:
+            logger.warning(f"TTS 캐시 저장 실패: {cache_path}, error={e}")
+
+        return audio_bytes
+
+    async def _encode_paragraphs_mp3(
         self,
-        chunks: list[bytes],
+        tasks: deque[asyncio.Task[bytes]],
         silence_ms: int | None = None,
     ) -> tuple[bytes, float]:
         """
-        오디오 청크들을 silence padding과 함께 병합합니다.
+        문단 TTS 결과(PCM)를 순서대로 ffmpeg에 흘려 보내 MP3로 인코딩합니다.
+
+        앞 문단이 끝나는 즉시 인코더에 쓰므로, 뒤 문단의 TTS 호출과
+        MP3 인코딩이 겹쳐서 진행됩니다. 문단 사이에는 silence를 넣습니다.
+
+        인코더에 쓴 Task는 tasks에서 꺼내 버리므로 문단 PCM이 끝까지
+        메모리에 쌓이지 않습니다. 실패 시 tasks에 남은 Task는 호출자가 취소합니다.
 
         Args:
-            chunks: MP3 오디오 바이트 리스트
+            tasks: 문단 순서대로 정렬된 TTS Task deque (PCM 바이트 반환)
             silence_ms: 문단 사이 silence 길이 (ms). None이면 settings 값 사용
 
         Returns:
-            (병합된 MP3 바이트, 전체 duration 초)
+            (MP3 바이트, 전체 duration 초)
+
+        Raises:
+            RuntimeError: ffmpeg 인코딩 실패 시
         """
         if silence_ms is None:
             silence_ms = self.tts_silence_padding_ms
 
-        if not chunks:
+        if not tasks:
             raise ValueError("병합할 오디오 청크가 없습니다.")
 
-        # 첫 번째 청크로 시작
-        combined = AudioSegment.from_mp3(io.BytesIO(chunks[0]))
-
-        # silence 생성 (stereo, 44100Hz 기준)
-        silence = AudioSegment.silent(duration=silence_ms)
-
-        # 나머지 청크들을 silence와 함께 병합
-        for chunk in chunks[1:]:
-            audio_segment = AudioSegment.from_mp3(io.BytesIO(chunk))
-            combined = combined + silence + audio_segment
+        # silence PCM (signed 16-bit이므로 0이 무음)
+        silence_frames = TTS_PCM_FRAME_RATE * silence_ms // 1000
+        silence_pcm = b"\x00" * (silence_frames * TTS_PCM_FRAME_WIDTH)
+
+        # pydub가 export에 쓰는 것과 같은 ffmpeg 바이너리 사용
+        proc = await asyncio.create_subprocess_exec(
+            AudioSegment.converter,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(TTS_PCM_FRAME_RATE),
+            "-ac",
+            str(TTS_PCM_CHANNELS),
+            "-i",
+            "pipe:0",
+            "-f",
+            "mp3",
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # 파이프가 가득 차 멈추지 않도록 출력은 별도 Task에서 계속 읽음
+        stdout_reader = asyncio.create_task(proc.stdout.read())
+        stderr_reader = asyncio.create_task(proc.stderr.read())
 
-        # MP3로 내보내기
-        output_buffer = io.BytesIO()
-        combined.export(output_buffer, format="mp3")
-        output_bytes = output_buffer.getvalue()
+        total_bytes = 0
+        try:
+            try:
+                is_first = True
+                while tasks:
+                    chunk = await tasks.popleft()
+                    # 프레임 경계에 맞지 않는 꼬리 바이트는 잘라냄
+                    chunk = chunk[: len(chunk) - len(chunk) % TTS_PCM_FRAME_WIDTH]
+                    if not is_first:
+                        proc.stdin.write(silence_pcm)
+                        total_bytes += len(silence_pcm)
+                    is_first = False
+                    proc.stdin.write(chunk)
+                    total_bytes += len(chunk)
+                    await proc.stdin.drain()
+                proc.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                # ffmpeg가 먼저 종료됨: 아래에서 종료 코드와 stderr로 원인 보고
+                pass
+
+            output_bytes = await stdout_reader
+            error_output = await stderr_reader
+            returncode = await proc.wait()
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stdout_reader.cancel()
+            stderr_reader.cancel()
+
+        if returncode != 0:
+            raise RuntimeError(
+                f"MP3 인코딩 실패 (ffmpeg exit={returncode}): "
+                f"{error_output.decode(errors='replace').strip()}"
+            )
 
-        # duration 계산 (밀리초 → 초)
-        duration_sec = len(combined) / 1000.0
+        # duration 계산 (PCM 바이트 수 → 초)
+        duration_sec = total_bytes / (TTS_PCM_FRAME_RATE * TTS_PCM_FRAME_WIDTH)
 
         return output_bytes, duration_sec
 
@@ -588,19 +974,25 @@ class AudioService:
         article_id: str,
         user_id: str,
         storage: "StorageService | None" = None,
+        script_version: str | None = None,
     ) -> dict:
         """
         뉴스 스크립트를 음성으로 합성합니다.
 
-        1. 각 문단을 OpenAI TTS API로 합성 (병렬 처리)
-        2. 문단 사이에 silence padding 추가
-        3. 전체 오디오 병합 후 StorageService로 저장
+        1. 각 문단을 OpenAI TTS API로 합성 (병렬 처리, 문단 캐시 히트 시 생략)
+        2. 완료된 문단부터 순서대로 silence padding과 함께 MP3 인코더에 전달
+           (남은 문단의 TTS 호출과 인코딩이 겹쳐서 진행)
+        3. 인코딩된 MP3를 StorageService로 저장
+        4. 재요청 시 디코딩 없이 응답할 수 있도록 메타데이터 사이드카 저장
+           (users/{user_id}/audio/{article_id}.meta.json)
 
         Args:
             script: 합성할 뉴스 스크립트
             article_id: 아티클 ID (파일명에 사용)
             user_id: 사용자 ID (저장 경로에 사용)
             storage: StorageService 인스턴스 (None이면 get_storage_service() 사용)
+            script_version: 합성한 스크립트의 버전 (저장된 스크립트의 created_at).
+                메타데이터에 기록하여 재요청 시 같은 스크립트의 오디오인지 비교합니다.
 
         Returns:
             {
@@ -622,24 +1014,35 @@ class AudioService:
             f"문단 수={len(script.paragraphs)}, user_id={user_id}"
         )
 
-        # 각 문단을 병렬로 TTS 합성
-        tasks = [self._call_openai_tts(paragraph) for paragraph in script.paragraphs]
-        audio_chunks = await asyncio.gather(*tasks)
+        if storage is None:
+            from app.services.storage import get_storage_service
 
-        logger.debug(f"TTS API 호출 완료: {len(audio_chunks)}개 청크 생성")
+            storage = get_storage_service()
 
-        # 오디오 청크 병합
-        merged_audio, duration_sec = self._merge_audio_chunks(list(audio_chunks))
+        # 문단 캐시가 한도 없이 커지지 않도록 주기적으로 정리
+        if settings.TTS_PARAGRAPH_CACHE_ENABLED:
+            self._schedule_tts_cache_prune(storage)
 
-        logger.debug(f"오디오 병합 완료: duration={duration_sec:.1f}초")
+        # 각 문단을 병렬로 TTS 합성 (동시 요청 수는 _call_openai_tts에서 제한)
+        # 이전에 합성한 적 있는 문단은 캐시에서 가져옴
+        tasks = deque(
+            asyncio.create_task(self._synthesize_paragraph(paragraph, storage))
+            for paragraph in script.paragraphs
+        )
 
-        # StorageService로 저장
-        if storage is None:
-            from app.services.storage import get_storage_service
+        # 완료된 문단부터 순서대로 MP3 인코딩 (실패 시 남은 TTS 호출은 취소)
+        try:
+            merged_audio, duration_sec = await self._encode_paragraphs_mp3(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-            storage = get_storage_service()
+        logger.debug(
+            f"TTS 합성 및 인코딩 완료: {len(script.paragraphs)}개 문단, "
+            f"duration={duration_sec:.1f}초"
+        )
 
-        # 저장 경로
+        # StorageService로 저장
         path = f"users/{user_id}/audio/{article_id}.mp3"
         saved_path = await storage.save_bytes(
             path, merged_audio, content_type="audio/mpeg"
@@ -647,18 +1050,138 @@ class AudioService:
 
         file_size_bytes = len(merged_audio)
 
-        logger.info(
-            f"TTS 합성 완료: {saved_path}, "
-            f"duration={duration_sec:.1f}초, size={file_size_bytes / 1024:.1f}KB"
-        )
-
-        return {
+        result = {
             "audio_path": saved_path,
             "duration_sec": duration_sec,
             "file_size_bytes": file_size_bytes,
             "paragraph_count": len(script.paragraphs),
         }
 
+        # 메타데이터 사이드카 저장 (MP3 저장 이후에 기록)
+        # 합성 완료 시각이 아니라 합성한 스크립트의 버전으로 최신 여부를 판단함
+        await storage.save_json(
+            f"users/{user_id}/audio/{article_id}.meta.json",
+            {
+                **result,
+                "script_version": script_version,
+                "created_at": datetime.now().isoformat(),
+            },
+        )
+
+        logger.info(
+            f"TTS 합성 완료: {saved_path}, "
+            f"duration={duration_sec:.1f}초, size={file_size_bytes / 1024:.1f}KB"
+        )
+
+        return result
+
+
+class ScriptStreamParser:
+    """
+    스트리밍 텍스트에서 완성된 스크립트 문단을 점진적으로 추출합니다.
+
+    [스크립트] 마커 이후 빈 줄로 끝난 문단을 feed() 시점에 바로 돌려주므로,
+    전체 스트림이 끝나기 전에 문단 단위 처리(이벤트 전송 등)를 시작할 수 있습니다.
+    마커를 찾은 시점에 title도 확정됩니다.
+    finalize()는 이미 분리된 문단을 재사용하여 NewsScript를 만들며,
+    호출자가 전체 스트림 텍스트를 따로 보관할 필요가 없습니다.
+    """
+
+    SCRIPT_MARKER = "[스크립트]"
+
+    def __init__(self) -> None:
+        self.paragraphs: list[str] = []
+        self.title: str | None = None  # [스크립트] 마커를 찾으면 확정
+        self._head_parts: list[str] = []  # 마커 이전 텍스트 ([제목] 섹션)
+        self._head = ""
+        self._carry = ""  # 청크 경계에 걸친 마커 탐지용
+        self._pending = ""  # 아직 끝나지 않은 문단
+        self._in_script = False
+
+    def feed(self, delta: str) -> list[str]:
+        """
+        스트리밍 청크를 추가하고 새로 완성된 문단을 반환합니다.
+
+        Args:
+            delta: 새로 수신한 텍스트 청크
+
+        Returns:
+            이번 청크로 완성된 문단 리스트
+        """
+        if not self._in_script:
+            self._head_parts.append(delta)
+            window = self._carry + delta
+            if self.SCRIPT_MARKER not in window:
+                self._carry = window[-(len(self.SCRIPT_MARKER) - 1) :]
+                return []
+
+            # 마커 발견: 이전은 제목 섹션, 이후는 스크립트 본문
+            head = "".join(self._head_parts)
+            marker_idx = head.find(self.SCRIPT_MARKER)
+            self._head = head[:marker_idx]
+            self._head_parts = []
+            self._in_script = True
+            self.title = AudioService.parse_stream_title(
+                self._head + self.SCRIPT_MARKER
+            )
+            delta = head[marker_idx + len(self.SCRIPT_MARKER) :]
+
+        # 빈 줄로 분리 (마지막 조각은 아직 끝나지 않았을 수 있으므로 보류)
+        pieces = _PARAGRAPH_SPLIT_RE.split(self._pending + delta)
+        self._pending = pieces.pop()
+
+        new_paragraphs = [p.strip() for p in pieces if p.strip()]
+        self.paragraphs.extend(new_paragraphs)
+        return new_paragraphs
+
+    def finalize(self) -> tuple[list[str], NewsScript]:
+        """
+        스트림 종료 후 남은 문단을 정리하고 NewsScript를 생성합니다.
+
+        [스크립트] 마커를 찾지 못했거나 문단이 없으면
+        보관 중인 텍스트를 AudioService.parse_stream_result로 파싱합니다.
+        이때는 feed()로 전달된 문단이 없으므로 파싱된 문단 전체를 마지막 문단으로
+        돌려주고 title도 파싱 결과로 채워, 어느 경로든 호출자가 같은 방식으로
+        title/문단 이벤트를 보낼 수 있게 합니다.
+
+        Returns:
+            (마지막으로 완성된 문단 리스트, 파싱된 NewsScript)
+        """
+        last_paragraphs: list[str] = []
+        if self._pending.strip():
+            last_paragraphs.append(self._pending.strip())
+            self.paragraphs.extend(last_paragraphs)
+        self._pending = ""
+
+        if not self._in_script:
+            # 마커가 없으면 지금까지 받은 전체 텍스트가 _head_parts에 남아 있음
+            full_content = "".join(self._head_parts)
+            return self._finalize_fallback(full_content)
+
+        if not self.paragraphs:
+            # 마커 이후가 공백뿐이면 마커 이전 텍스트로 fallback 파싱
+            return self._finalize_fallback(self._head + self.SCRIPT_MARKER)
+
+        return last_paragraphs, AudioService.build_stream_script(
+            self.title or "", self.paragraphs
+        )
+
+    def _finalize_fallback(self, text: str) -> tuple[list[str], NewsScript]:
+        """
+        보관 중인 텍스트를 전체 파싱하고, 파싱된 문단 전체를 마지막 문단으로 반환합니다.
+
+        Args:
+            text: 파싱할 스트림 텍스트
+
+        Returns:
+            (파싱된 문단 리스트, 파싱된 NewsScript)
+        """
+        result = AudioService.parse_stream_result(text)
+        self.paragraphs = list(result.paragraphs)
+        if self.title is None:
+            self.title = result.title
+        return list(result.paragraphs), result
+
 
 # 싱글톤 인스턴스 (지연 초기화)
 _audio_service: AudioService | None = None
@@ -675,3 +1198,13 @@ def get_audio_service() -> AudioService:
     if _audio_service is None:
         _audio_service = AudioService()
     return _audio_service
+
+
+async def close_audio_service() -> None:
+    """
+    생성된 AudioService가 있으면 외부 API 커넥션을 정리합니다.
+
+    아직 생성되지 않았다면 새로 만들지 않습니다.
+    """
+    if _audio_service is not None:
+        await _audio_service.aclose()
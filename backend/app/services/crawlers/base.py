@@ -9,15 +9,205 @@ Base Crawler Module
 - 파일 저장 기능 제외 (MVP는 API 응답 중심)
 """
 
+import asyncio
+import copy
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import (
+    BeautifulSoup,
+    FeatureNotFound,
+    ParserRejectedMarkup,
+    SoupStrainer,
+    Tag,
+)
 from loguru import logger
 
 from app.services.crawlers.schemas import ArticleMetadata, CrawledArticle
 
+# 기본 HTML 파서 (C 기반 lxml, html.parser 대비 수 배 빠름)
+HTML_PARSER = "lxml"
+# lxml 미설치 또는 파싱 거부 시 사용할 순수 Python 파서
+FALLBACK_HTML_PARSER = "html.parser"
+
+# 추출할 OG 태그 매핑 (og_property -> dict_key)
+OG_META_KEYS: dict[str, str] = {
+    "og:title": "og_title",
+    "og:description": "og_description",
+    "og:url": "og_url",
+    "og:image": "og_image",
+    "article:published_time": "published_at",
+    "article:author": "author",
+}
+
+# clean_text 정규식 (모듈 로드 시 1회 컴파일)
+_RE_MULTINEWLINE = re.compile(r"\n{3,}")
+_RE_MULTISPACE = re.compile(r"[ \t]+")
+
+# clean_text 결과를 캐시할 최대 입력 길이 (본문처럼 긴 텍스트는 캐시하지 않음)
+CLEAN_TEXT_CACHE_MAX_LEN = 256
+
+
+def _normalize_text(text: str) -> str:
+    """clean_text의 공백/줄바꿈 정규화 본체"""
+    # 연속된 줄바꿈(3줄 이상) → 2줄로 정리
+    text = _RE_MULTINEWLINE.sub("\n\n", text)
+    # 탭/연속 공백 → 스페이스 1개
+    text = _RE_MULTISPACE.sub(" ", text)
+    # 각 줄의 앞뒤 공백 제거 (map + str.strip으로 C 레벨에서 처리)
+    return "\n".join(map(str.strip, text.split("\n"))).strip()
+
+
+@lru_cache(maxsize=8192)
+def _clean_short_text(text: str) -> str:
+    """짧은 텍스트용 _normalize_text 캐시"""
+    return _normalize_text(text)
+
+
+# 크롤러 공용 HTTP 커넥션 풀 한도 (요청 간 TCP/TLS 커넥션 재사용)
+CRAWLER_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+)
+
+# 프로세스 공용 크롤러 HTTP 트랜스포트 (get_http_transport()로 지연 생성)
+_http_transport: httpx.AsyncHTTPTransport | None = None
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    공용 트랜스포트에 요청을 위임하고, 클라이언트가 닫혀도 풀은 유지하는 래퍼
+
+    요청마다 여는 AsyncClient가 종료될 때 공용 커넥션 풀까지 닫지 않도록
+    aclose()는 아무것도 하지 않습니다. 풀 정리는 close_http_transport()가 담당합니다.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def get_http_transport() -> httpx.AsyncBaseTransport:
+    """
+    크롤러 공용 HTTP 트랜스포트를 반환합니다 (Singleton).
+
+    요청마다 커넥션 풀을 새로 열면 매번 TCP/TLS 핸드셰이크가 발생하므로
+    풀은 프로세스 단위로 공유합니다. 쿠키/리다이렉트는 클라이언트 계층이
+    처리하므로, fetch마다 이 트랜스포트 위에 가벼운 AsyncClient를 열면
+    fetch별 쿠키 저장소를 유지하면서 커넥션만 재사용할 수 있습니다.
+    """
+    global _http_transport
+    if _http_transport is None:
+        _http_transport = httpx.AsyncHTTPTransport(limits=CRAWLER_HTTP_LIMITS)
+    return _SharedTransport(_http_transport)
+
+
+async def close_http_transport() -> None:
+    """
+    생성된 크롤러 공용 HTTP 트랜스포트가 있으면 커넥션을 정리합니다.
+
+    아직 생성되지 않았다면 새로 만들지 않습니다.
+    """
+    global _http_transport
+    if _http_transport is not None:
+        await _http_transport.aclose()
+        _http_transport = None
+
+
+@lru_cache(maxsize=4096)
+def normalize_domain(url: str) -> str:
+    """
+    URL에서 소문자 도메인을 추출합니다 (www. 접두사 제거).
+
+    한 요청 안에서 검증/플랫폼 감지/크롤러 선택이 같은 URL을 반복 파싱하므로
+    결과를 URL 단위로 캐시합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 도메인 (예: "https://www.Medium.com/x" → "medium.com")
+    """
+    domain = urlparse(url).netloc.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain
+
+
+def _collect_og_meta(scope: Tag) -> dict:
+    """
+    scope 하위의 meta[property] 태그를 한 번 순회하며 OG 정보를 수집합니다.
+
+    Args:
+        scope: 탐색 범위 (BeautifulSoup 또는 <head> 등 Tag)
+
+    Returns:
+        OG 메타 정보 딕셔너리
+    """
+    meta_info = {}
+    seen: set[str] = set()
+
+    for tag in scope.find_all("meta", property=True):
+        key = OG_META_KEYS.get(tag["property"])
+        # 속성별 첫 번째 태그만 사용 (기존 find() 동작과 동일)
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+        if tag.get("content"):
+            meta_info[key] = tag["content"]
+        # 모든 OG 속성을 확인했으면 나머지 meta 태그는 볼 필요 없음
+        if len(seen) == len(OG_META_KEYS):
+            break
+
+    return meta_info
+
+
+def compile_selectors(selectors: list[str]) -> sv.SoupSieve:
+    """
+    CSS 선택자 목록을 하나의 결합 패턴으로 컴파일합니다.
+
+    결합 패턴은 목록 중 하나라도 일치하는 요소를 트리 1회 순회로 찾습니다.
+    (우선순위가 있는 목록은 개별 select_one 호출을 유지해야 합니다)
+
+    Args:
+        selectors: CSS 선택자 목록
+
+    Returns:
+        컴파일된 SoupSieve 패턴
+    """
+    return sv.compile(", ".join(selectors))
+
+
+def make_soup(html: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """
+    HTML 문자열을 BeautifulSoup 객체로 파싱합니다.
+
+    lxml 파서를 우선 사용하고, 사용할 수 없거나 마크업을 거부하면
+    html.parser로 재시도합니다.
+
+    Args:
+        html: HTML 문자열
+        parse_only: 지정 시 일치하는 태그만 트리로 생성 (SoupStrainer)
+
+    Returns:
+        BeautifulSoup 객체
+    """
+    try:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    except (FeatureNotFound, ParserRejectedMarkup) as e:
+        logger.warning(f"lxml parse failed, falling back to html.parser: {e}")
+        return BeautifulSoup(html, FALLBACK_HTML_PARSER, parse_only=parse_only)
+
 
 class BaseTextExtractor:
     """
@@ -36,42 +226,50 @@ class BaseTextExtractor:
         - 탭/연속 공백 → 스페이스 1개로 정규화
         - 각 줄의 앞뒤 공백 제거
 
+        빈 문자열/공백만 있는 입력은 바로 반환하고, 제목·작성자·시간처럼
+        짧고 반복되는 문자열은 결과를 캐시합니다.
+
         Args:
             text: 원본 텍스트
 
         Returns:
             정리된 텍스트
         """
-        if not text:
+        if not text or text.isspace():
             return ""
-
-        # 연속된 줄바꿈(3줄 이상) → 2줄로 정리
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        # 탭/연속 공백 → 스페이스 1개
-        text = re.sub(r"[ \t]+", " ", text)
-        # 각 줄의 앞뒤 공백 제거
-        lines = [line.strip() for line in text.split("\n")]
-        return "\n".join(lines).strip()
+        if len(text) < CLEAN_TEXT_CACHE_MAX_LEN:
+            # NavigableString 등 str 하위 타입이 캐시 키로 트리를 붙잡지 않도록 변환
+            return _clean_short_text(str(text))
+        return _normalize_text(text)
 
     @staticmethod
     def remove_noise_elements(
-        soup: BeautifulSoup, selectors: list[str]
+        soup: BeautifulSoup,
+        selectors: list[str] | sv.SoupSieve,
+        mutate: bool = False,
     ) -> BeautifulSoup:
         """
         광고, 네비게이션 등 노이즈 요소를 제거합니다.
 
         Args:
             soup: BeautifulSoup 객체
-            selectors: 제거할 CSS 선택자 목록
+            selectors: 제거할 CSS 선택자 목록 또는 compile_selectors() 결과
+            mutate: True면 원본 트리를 직접 수정 (호출자가 원본을 더 이상 쓰지 않을 때)
 
         Returns:
-            노이즈가 제거된 BeautifulSoup 객체 (원본을 수정하지 않음)
+            노이즈가 제거된 BeautifulSoup 객체 (mutate=False면 원본을 수정하지 않음)
         """
-        # 원본을 보존하기 위해 복사본 생성
-        soup_copy = BeautifulSoup(str(soup), "html.parser")
-
-        for selector in selectors:
-            for element in soup_copy.select(selector):
+        # 원본 보존이 필요하면 재파싱 대신 트리 복사
+        soup_copy = soup if mutate else copy.copy(soup)
+
+        pattern = (
+            selectors
+            if isinstance(selectors, sv.SoupSieve)
+            else compile_selectors(selectors)
+        )
+        for element in pattern.select(soup_copy):
+            # 이미 제거된 부모 요소의 하위 요소는 건너뜀
+            if not element.decomposed:
                 element.decompose()
 
         return soup_copy
@@ -117,19 +315,50 @@ class BaseCrawler(ABC):
     # 클래스 변수: 플랫폼 식별자 (하위 클래스에서 오버라이드)
     platform_name: str = "base"
 
-    # 기본 요청 헤더
-    DEFAULT_HEADERS: dict = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    }
+    # 기본 요청 헤더 (읽기 전용, 인스턴스 간 공유)
+    DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType(
+        {
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+        }
+    )
 
     # 기본 HTTP 타임아웃 (초)
     DEFAULT_TIMEOUT: float = 30.0
 
+    # 응답 본문 최대 크기 (바이트). 초과분은 읽지 않고 잘라냄
+    MAX_RESPONSE_BYTES: int = 5 * 1024 * 1024
+
+    # 응답 본문 스트리밍 청크 크기 (바이트)
+    RESPONSE_CHUNK_SIZE: int = 64 * 1024
+
+    # 2차 URL 동시 크롤링 최대 개수
+    MAX_CONCURRENCY: int = 10
+
+    # 2차 URL 동시 크롤링 시 호스트별 최대 개수
+    MAX_CONCURRENCY_PER_HOST: int = 4
+
+    # 메타 정보 전용 파싱 범위 (extract_og_meta + <title>만 필요한 경우)
+    META_STRAINER: SoupStrainer = SoupStrainer(["meta", "title"])
+
+    # 본문 전용 파싱 범위 (하위 클래스에서 필요 시 오버라이드, 예: SoupStrainer("article"))
+    CONTENT_STRAINER: SoupStrainer | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        하위 클래스 생성 시 *_SELECTORS 목록을 *_SELECTORS_COMPILED로 1회 컴파일합니다.
+
+        요청마다 선택자 문자열을 다시 해석하지 않도록 클래스 단위로 캐시합니다.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.endswith("_SELECTORS") and isinstance(value, list):
+                setattr(cls, f"{name}_COMPILED", compile_selectors(value))
+
     def __init__(
         self,
         timeout: float | None = None,
@@ -141,7 +370,8 @@ class BaseCrawler(ABC):
             headers: 커스텀 HTTP 헤더. 기본값은 DEFAULT_HEADERS
         """
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.headers = headers or self.DEFAULT_HEADERS.copy()
+        # 기본 헤더는 읽기 전용이므로 복사 없이 공유
+        self.headers: Mapping[str, str] = headers or self.DEFAULT_HEADERS
         self.text_extractor = BaseTextExtractor()
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -153,6 +383,10 @@ class BaseCrawler(ABC):
         URL에서 HTML을 비동기로 가져옵니다.
 
         httpx를 사용하여 FastAPI 비동기 패턴과 호환됩니다.
+        fetch마다 AsyncClient를 열어 리다이렉트 중 설정된 쿠키(동의 쿠키 등)는
+        해당 fetch 안에서만 유지하고, 커넥션 풀(get_http_transport)은 재사용합니다.
+        본문은 스트리밍으로 읽으며 MAX_RESPONSE_BYTES를 넘으면 그 지점에서
+        잘라내어 비정상적으로 큰 페이지의 메모리 사용을 제한합니다.
 
         Args:
             url: 크롤링할 URL
@@ -163,16 +397,32 @@ class BaseCrawler(ABC):
         try:
             logger.info(f"Fetching HTML from: {url}")
 
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                headers=self.headers,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
+            async with (
+                httpx.AsyncClient(
+                    transport=get_http_transport(),
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    follow_redirects=True,
+                ) as client,
+                client.stream("GET", url) as response,
+            ):
                 response.raise_for_status()
 
-                # httpx는 자동으로 인코딩을 처리함
-                return response.text
+                chunks: list[bytes] = []
+                total = 0
+                async for chunk in response.aiter_bytes(self.RESPONSE_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= self.MAX_RESPONSE_BYTES:
+                        logger.warning(
+                            f"Response exceeds {self.MAX_RESPONSE_BYTES:,} bytes, "
+                            f"truncating: {url}"
+                        )
+                        break
+
+                # 헤더 charset 우선, 없으면 클라이언트 기본 인코딩 (response.text와 동일)
+                data = b"".join(chunks)[: self.MAX_RESPONSE_BYTES]
+                return data.decode(response.encoding or "utf-8", errors="replace")
 
         except httpx.TimeoutException:
             logger.error(f"Timeout while fetching {url}")
@@ -194,41 +444,48 @@ class BaseCrawler(ABC):
         Returns:
             BeautifulSoup 객체
         """
-        return BeautifulSoup(html, "html.parser")
+        return make_soup(html)
 
-    def extract_og_meta(self, soup: BeautifulSoup) -> dict:
+    def parse_html_strained(self, html: str, strainer: SoupStrainer) -> BeautifulSoup:
         """
-        Open Graph 메타 태그에서 정보를 추출합니다.
+        HTML 중 strainer와 일치하는 태그만 BeautifulSoup 객체로 파싱합니다.
+
+        전체 DOM을 만들지 않으므로 메타 태그나 본문 영역만 필요할 때
+        parse_html()보다 생성되는 객체 수와 파싱 시간이 크게 줄어듭니다.
+        일치하는 태그만 루트 바로 아래에 평탄하게 배치됩니다.
 
         Args:
-            soup: BeautifulSoup 객체
+            html: HTML 문자열
+            strainer: 파싱할 태그를 지정하는 SoupStrainer
+                (META_STRAINER, CONTENT_STRAINER 등)
 
         Returns:
-            OG 메타 정보 딕셔너리
+            strainer 범위만 포함된 BeautifulSoup 객체
         """
-        meta_info = {}
+        return make_soup(html, parse_only=strainer)
 
-        # 추출할 OG 태그 매핑 (og_property -> dict_key)
-        og_tags = [
-            ("og:title", "og_title"),
-            ("og:description", "og_description"),
-            ("og:url", "og_url"),
-            ("og:image", "og_image"),
-            ("article:published_time", "published_at"),
-            ("article:author", "author"),
-        ]
+    def extract_og_meta(self, soup: BeautifulSoup) -> dict:
+        """
+        Open Graph 메타 태그에서 정보를 추출합니다.
 
-        for og_property, key in og_tags:
-            tag = soup.find("meta", property=og_property)
-            if tag and tag.get("content"):
-                meta_info[key] = tag["content"]
+        Args:
+            soup: BeautifulSoup 객체 (전체 파싱 또는 META_STRAINER로 부분 파싱)
 
-        return meta_info
+        Returns:
+            OG 메타 정보 딕셔너리
+        """
+        # OG 태그는 head/body 어디에나 있을 수 있으므로 문서 전체를 한 번 순회
+        # (OG 태그가 없는 페이지는 빈 딕셔너리를 그대로 반환)
+        return _collect_og_meta(soup)
 
     def _build_metadata(self, og_meta: dict, **extra_fields) -> ArticleMetadata:
         """
         OG 메타 정보와 추가 필드를 결합하여 ArticleMetadata를 생성합니다.
 
+        값은 모두 크롤러가 파싱한 str/int/list[str]이므로 pydantic 검증을
+        생략하고 model_construct로 생성합니다. 새 필드를 넘길 때는
+        스키마 타입에 맞게 변환해서 전달해야 합니다.
+
         Args:
             og_meta: extract_og_meta()에서 추출한 딕셔너리
             **extra_fields: 추가 메타데이터 필드
@@ -237,7 +494,7 @@ class BaseCrawler(ABC):
             ArticleMetadata 인스턴스
         """
         combined = {**og_meta, **extra_fields}
-        return ArticleMetadata(**combined)
+        return ArticleMetadata.model_construct(**combined)
 
     # ─────────────────────────────────────────────────────────────────────────
     # 추상 메서드 (하위 클래스에서 구현 필수)
@@ -295,7 +552,7 @@ class BaseCrawler(ABC):
         pass
 
     # ─────────────────────────────────────────────────────────────────────────
-    # 2차 URL 크롤링 (stub - 추후 구현)
+    # 2차 URL 크롤링
     # ─────────────────────────────────────────────────────────────────────────
 
     def extract_secondary_urls(self, soup: BeautifulSoup) -> list[str]:
@@ -315,17 +572,41 @@ class BaseCrawler(ABC):
 
     async def crawl_secondary(self, urls: list[str]) -> list[CrawledArticle]:
         """
-        2차 URL들을 크롤링합니다.
+        2차 URL들을 동시에 크롤링합니다.
 
-        현재는 미구현 상태입니다. 추후 확장 시 구현 예정.
+        각 URL은 extract()로 처리하며, 공용 커넥션 풀 위에서
+        MAX_CONCURRENCY개까지만 동시에 요청합니다. 같은 호스트에는
+        MAX_CONCURRENCY_PER_HOST개까지만 동시에 요청하여 keep-alive
+        커넥션을 재사용하고 한 사이트에 요청이 몰리지 않게 합니다.
+        실패하거나 예외가 발생한 URL은 결과에서 제외됩니다.
 
         Args:
             urls: 크롤링할 URL 목록
 
         Returns:
-            CrawledArticle 목록
-
-        Raises:
-            NotImplementedError: 아직 구현되지 않음
+            CrawledArticle 목록 (입력 순서 유지)
         """
-        raise NotImplementedError("Secondary URL crawling is not yet implemented")
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        host_semaphores: dict[str, asyncio.BoundedSemaphore] = {}
+
+        async def crawl_one(url: str) -> CrawledArticle | None:
+            host = normalize_domain(url)
+            host_semaphore = host_semaphores.get(host)
+            if host_semaphore is None:
+                host_semaphore = asyncio.BoundedSemaphore(self.MAX_CONCURRENCY_PER_HOST)
+                host_semaphores[host] = host_semaphore
+
+            async with host_semaphore, semaphore:
+                return await self.extract(url)
+
+        results = await asyncio.gather(
+            *(crawl_one(url) for url in urls), return_exceptions=True
+        )
+
+        articles = []
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, CrawledArticle):
+                articles.append(result)
+            elif isinstance(result, Exception):
+                logger.error(f"Secondary crawl failed for {url}: {result}")
+        return articles
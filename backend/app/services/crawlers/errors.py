@@ -15,37 +15,69 @@ from enum import Enum
 
 
 class CrawlErrorCode(str, Enum):
-    """크롤링 에러 코드"""
-
-    INVALID_URL_FORMAT = "INVALID_URL_FORMAT"
-    EMPTY_INPUT = "EMPTY_INPUT"
-    UNSUPPORTED_CONTENT = "UNSUPPORTED_CONTENT"
-    NO_CONTENT = "NO_CONTENT"
-    CRAWL_FAILED = "CRAWL_FAILED"
-    TIMEOUT = "TIMEOUT"
-    NETWORK_ERROR = "NETWORK_ERROR"
+    """
+    크롤링 에러 코드
 
+    각 멤버는 (코드, 사용자 친화적 메시지, HTTP 상태 코드)로 정의되며,
+    value는 코드 문자열 그대로 유지됩니다.
+    메시지/상태 코드는 default_message, http_status 속성으로 바로 접근합니다.
+    """
 
-# 에러 코드별 사용자 친화적 메시지 (한국어)
+    default_message: str
+    http_status: int
+
+    def __new__(cls, code: str, default_message: str, http_status: int):
+        member = str.__new__(cls, code)
+        member._value_ = code
+        member.default_message = default_message
+        member.http_status = http_status
+        return member
+
+    INVALID_URL_FORMAT = (
+        "INVALID_URL_FORMAT",
+        "앗, 올바른 주소인지 확인해 주세요. URL 형식이 필요해요.",
+        400,
+    )
+    EMPTY_INPUT = (
+        "EMPTY_INPUT",
+        "앗, 주소를 입력하지 않으셨어요. 분석할 URL을 넣어주세요.",
+        400,
+    )
+    UNSUPPORTED_CONTENT = (
+        "UNSUPPORTED_CONTENT",
+        "앗, 이 페이지의 내용은 읽어오기 어려워요. 일반적인 뉴스나 블로그 주소인가요?",
+        415,
+    )
+    NO_CONTENT = (
+        "NO_CONTENT",
+        "앗, 페이지가 비어 있는 것 같아요. 다른 주소로 다시 시도해 볼까요?",
+        422,
+    )
+    CRAWL_FAILED = (
+        "CRAWL_FAILED",
+        "앗, 페이지 내용을 불러오지 못했어요. 다른 주소로 시도해 주세요.",
+        502,
+    )
+    TIMEOUT = (
+        "TIMEOUT",
+        "앗, 응답 시간이 너무 길어지고 있어요. 잠시 후 다시 시도해 주시겠어요?",
+        504,
+    )
+    NETWORK_ERROR = (
+        "NETWORK_ERROR",
+        "앗, 네트워크 연결에 문제가 있어요. 인터넷 연결을 확인해 주세요.",
+        502,
+    )
+
+
+# 에러 코드별 사용자 친화적 메시지 (한국어) - CrawlErrorCode에서 파생
 ERROR_MESSAGES: dict[CrawlErrorCode, str] = {
-    CrawlErrorCode.INVALID_URL_FORMAT: "앗, 올바른 주소인지 확인해 주세요. URL 형식이 필요해요.",
-    CrawlErrorCode.EMPTY_INPUT: "앗, 주소를 입력하지 않으셨어요. 분석할 URL을 넣어주세요.",
-    CrawlErrorCode.UNSUPPORTED_CONTENT: "앗, 이 페이지의 내용은 읽어오기 어려워요. 일반적인 뉴스나 블로그 주소인가요?",
-    CrawlErrorCode.NO_CONTENT: "앗, 페이지가 비어 있는 것 같아요. 다른 주소로 다시 시도해 볼까요?",
-    CrawlErrorCode.CRAWL_FAILED: "앗, 페이지 내용을 불러오지 못했어요. 다른 주소로 시도해 주세요.",
-    CrawlErrorCode.TIMEOUT: "앗, 응답 시간이 너무 길어지고 있어요. 잠시 후 다시 시도해 주시겠어요?",
-    CrawlErrorCode.NETWORK_ERROR: "앗, 네트워크 연결에 문제가 있어요. 인터넷 연결을 확인해 주세요.",
+    code: code.default_message for code in CrawlErrorCode
 }
 
-# 에러 코드별 HTTP 상태 코드 매핑
+# 에러 코드별 HTTP 상태 코드 매핑 - CrawlErrorCode에서 파생
 ERROR_HTTP_STATUS: dict[CrawlErrorCode, int] = {
-    CrawlErrorCode.INVALID_URL_FORMAT: 400,
-    CrawlErrorCode.EMPTY_INPUT: 400,
-    CrawlErrorCode.UNSUPPORTED_CONTENT: 415,
-    CrawlErrorCode.NO_CONTENT: 422,
-    CrawlErrorCode.CRAWL_FAILED: 502,
-    CrawlErrorCode.TIMEOUT: 504,
-    CrawlErrorCode.NETWORK_ERROR: 502,
+    code: code.http_status for code in CrawlErrorCode
 }
 
 
@@ -67,11 +99,9 @@ class CrawlError(Exception):
         detail: str | None = None,
     ):
         self.code = code
-        self.message = message or ERROR_MESSAGES.get(
-            code, "알 수 없는 오류가 발생했습니다."
-        )
+        self.message = message or code.default_message
         self.detail = detail
-        self.http_status = ERROR_HTTP_STATUS.get(code, 500)
+        self.http_status = code.http_status
 
         super().__init__(self.message)
 
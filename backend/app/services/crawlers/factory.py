@@ -19,11 +19,9 @@ Usage:
     새 플랫폼 추가 시 _crawlers 딕셔너리에 한 줄만 추가하면 됩니다.
 """
 
-from urllib.parse import urlparse
-
 from loguru import logger
 
-from app.services.crawlers.base import BaseCrawler
+from app.services.crawlers.base import BaseCrawler, normalize_domain
 from app.services.crawlers.geeknews import GeekNewsCrawler
 from app.services.crawlers.generic import GenericCrawler
 from app.services.crawlers.medium import MediumCrawler
@@ -108,31 +106,22 @@ class CrawlerFactory:
             ...     "https://example.com/article"
             ... )
         """
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-
-        # www. 접두사 제거
-        if domain.startswith("www."):
-            domain = domain[4:]
+        domain = normalize_domain(url)
 
         logger.debug(f"URL 도메인 파싱: {url} → {domain}")
 
         # 1. 전용 크롤러 매칭 시도
-        for pattern, crawler_cls in cls._crawlers.items():
-            if cls._match_domain(domain, pattern):
-                logger.info(
-                    f"전용 크롤러 선택: {crawler_cls.platform_name} for {domain}"
-                )
-                return crawler_cls(**kwargs)
+        crawler_cls = cls._find_crawler(domain)
+        if crawler_cls is not None:
+            logger.info(f"전용 크롤러 선택: {crawler_cls.platform_name} for {domain}")
+            return crawler_cls(**kwargs)
 
         # 2. fallback: GenericCrawler 사용
         if use_fallback:
-            generic_crawler = GenericCrawler(**kwargs)
-
-            # GenericCrawler가 해당 URL을 처리할 수 있는지 확인
-            if generic_crawler.validate_url(url):
+            # GenericCrawler가 해당 URL을 처리할 수 있는지 확인 (인스턴스 생성 전)
+            if GenericCrawler.validate_url(url):
                 logger.info(f"범용 크롤러 선택: generic for {domain}")
-                return generic_crawler
+                return GenericCrawler(**kwargs)
             else:
                 # GenericCrawler도 지원하지 않는 URL (예: YouTube, Twitter 등)
                 logger.warning(f"지원하지 않는 콘텐츠 타입: {domain}")
@@ -147,9 +136,12 @@ class CrawlerFactory:
         raise UnsupportedURLError(url=url, domain=domain)
 
     @classmethod
-    def _match_domain(cls, domain: str, pattern: str) -> bool:
+    def _find_crawler(cls, domain: str) -> type[BaseCrawler] | None:
         """
-        도메인이 패턴과 일치하는지 확인합니다.
+        도메인에 해당하는 전용 크롤러 클래스를 찾습니다.
+
+        패턴 목록을 순회하지 않고, 도메인의 접미사를 긴 것부터
+        _crawlers 딕셔너리에서 직접 조회합니다 (라벨 수만큼의 dict 조회).
 
         다음 케이스를 처리합니다:
         - 정확히 일치: news.hada.io == news.hada.io
@@ -157,20 +149,24 @@ class CrawlerFactory:
 
         Args:
             domain: 검사할 도메인 (www. 제거됨)
-            pattern: 매칭할 패턴
 
         Returns:
-            일치하면 True, 아니면 False
+            일치하는 크롤러 클래스 또는 None
         """
         # 정확히 일치
-        if domain == pattern:
-            return True
+        crawler_cls = cls._crawlers.get(domain)
+        if crawler_cls is not None:
+            return crawler_cls
 
-        # 서브도메인 일치 (예: *.medium.com)
-        if domain.endswith(f".{pattern}"):
-            return True
+        # 서브도메인 일치 (예: *.medium.com) - 가장 구체적인 접미사부터
+        index = domain.find(".")
+        while index != -1:
+            crawler_cls = cls._crawlers.get(domain[index + 1 :])
+            if crawler_cls is not None:
+                return crawler_cls
+            index = domain.find(".", index + 1)
 
-        return False
+        return None
 
     @classmethod
     def get_supported_domains(cls) -> list[str]:
@@ -217,24 +213,19 @@ class CrawlerFactory:
             {"platform": "unsupported", "is_specialized": False, "domain": "youtube.com"}
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            if domain.startswith("www."):
-                domain = domain[4:]
+            domain = normalize_domain(url)
 
             # 1. 전용 크롤러 확인
-            for pattern, crawler_cls in cls._crawlers.items():
-                if cls._match_domain(domain, pattern):
-                    return {
-                        "platform": crawler_cls.platform_name,
-                        "is_specialized": True,
-                        "domain": domain,
-                    }
+            crawler_cls = cls._find_crawler(domain)
+            if crawler_cls is not None:
+                return {
+                    "platform": crawler_cls.platform_name,
+                    "is_specialized": True,
+                    "domain": domain,
+                }
 
             # 2. GenericCrawler 지원 여부 확인
-            generic_crawler = GenericCrawler()
-            if generic_crawler.validate_url(url):
+            if GenericCrawler.validate_url(url):
                 return {
                     "platform": "generic",
                     "is_specialized": False,
@@ -16,16 +16,210 @@ Usage:
     crawler = GeekNewsCrawler(crawl_original=True)
 """
 
+import asyncio
+import io
 import re
 
+import soupsieve as sv
 import trafilatura
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
+from lxml import etree
 
 from app.core.config import settings
 from app.services.crawlers.base import BaseCrawler
 from app.services.crawlers.schemas import CrawledArticle
 
+# GeekNews 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_URL_RE = re.compile(r"https?://(www\.)?news\.hada\.io/topic\?id=\d+")
+_TITLE_SUFFIX_RE = re.compile(r"\s*\|\s*GeekNews\s*$")
+_POINTS_RE = re.compile(r"(\d+)P")
+_REL_TIME_RE = re.compile(r"(\d+[일시분초]+\s*전)")
+_DEPTH_RE = re.compile(r"--depth:(\d+)")
+_COMMENT_COUNT_LINK_RE = re.compile(r"댓글\s*\d+개")
+_COMMENT_COUNT_NUM_RE = re.compile(r"(\d+)")
+_ID_RE = re.compile(r"id=(\d+)")
+
+# validate_url 빠른 경로용 URL 접두사 (_URL_RE와 동일한 범위)
+_URL_PREFIXES = tuple(
+    f"{scheme}://{host}/topic?id="
+    for scheme in ("https", "http")
+    for host in ("news.hada.io", "www.news.hada.io")
+)
+
+# GeekNews DOM 선택자 (모듈 로드 시 1회 컴파일)
+_TITLE_H1_SEL = sv.compile(".topictitle h1")
+_TITLE_LINK_SEL = sv.compile(".topictitle a.ud")
+_TOPICINFO_SEL = sv.compile(".topicinfo")
+_AUTHOR_LINK_SEL = sv.compile("a[href*='/user']")
+_TIME_SPAN_SEL = sv.compile("span[title]")
+_TOPIC_CONTENTS_SEL = sv.compile(".topic_contents")
+_INNER_CONTENT_SEL = sv.compile("#topic_contents, span")
+
+# 댓글 깊이별 들여쓰기 문자열 (깊이 64 이상은 직접 생성)
+_INDENTS = tuple("  " * depth for depth in range(64))
+
+# _format_content 변환 대상 태그
+_HEADER_PREFIX = {f"h{i}": "#" * i for i in range(1, 7)}
+_FORMAT_TAGS = ["li", *_HEADER_PREFIX, "blockquote", "code"]
+# 내용을 텍스트로 치환하는 태그의 적용 순서
+_REPLACE_ORDER = {
+    name: i for i, name in enumerate([*_HEADER_PREFIX, "blockquote", "code"])
+}
+
+
+def _class_predicate(name: str) -> str:
+    """class 속성에 name 토큰이 있는지 검사하는 XPath 조건식을 반환합니다."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _simple_css_to_xpath(selector: str) -> str:
+    """tag, .class, #id, [attr="value"] 형태의 단순 CSS 선택자를 XPath 식으로 변환합니다."""
+    if selector.startswith("."):
+        return f"//*[{_class_predicate(selector[1:])}]"
+    if selector.startswith("#"):
+        return f"//*[@id='{selector[1:]}']"
+    if selector.startswith("["):
+        attr, value = selector[1:-1].split("=", 1)
+        return f"//*[@{attr}={value}]"
+    return f"//{selector}"
+
+
+# fallback 본문 추출 시 제거할 일반 아티클 노이즈 요소 선택자
+_FALLBACK_NOISE_SELECTORS = [
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    ".sidebar",
+    ".advertisement",
+    ".ad",
+    ".social-share",
+    ".comments",
+    ".related-posts",
+    "iframe",
+    ".nav",
+    ".menu",
+    ".navigation",
+]
+# 노이즈 선택자 전체를 하나의 XPath 합집합으로 컴파일 (class 조건은 한 번의 순회로 검사)
+_FALLBACK_NOISE_XPATH = etree.XPath(
+    " | ".join(
+        [
+            *(
+                _simple_css_to_xpath(selector)
+                for selector in _FALLBACK_NOISE_SELECTORS
+                if not selector.startswith(".")
+            ),
+            "//*[@class]["
+            + " or ".join(
+                _class_predicate(selector[1:])
+                for selector in _FALLBACK_NOISE_SELECTORS
+                if selector.startswith(".")
+            )
+            + "]",
+        ]
+    )
+)
+
+# fallback 본문 추출 우선순위 (일반적인 아티클 구조)
+_FALLBACK_CONTENT_SELECTORS = [
+    "article",
+    '[role="main"]',
+    "main",
+    ".post-content",
+    ".article-content",
+    ".entry-content",
+    ".content",
+    ".post-body",
+    "#content",
+    ".prose",  # Tailwind CSS 기반 사이트
+]
+# 우선순위를 지켜야 하므로 합치지 않고 선택자별로 첫 번째 요소만 조회
+_FALLBACK_CONTENT_XPATHS = [
+    etree.XPath(f"({_simple_css_to_xpath(selector)})[1]")
+    for selector in _FALLBACK_CONTENT_SELECTORS
+]
+
+
+# 댓글 스트리밍 파싱용 식별자 / 선택자 (댓글 행 기준 상대 경로)
+_COMMENT_THREAD = "comment_thread"
+_COMMENT_ROW = "comment_row"
+_COMMENT_AUTHOR_XPATH = etree.XPath(
+    f"(.//*[{_class_predicate('commentinfo')}]//a[contains(@href, '/user')])[1]"
+)
+_COMMENT_TIME_XPATH = etree.XPath(
+    f"(.//*[{_class_predicate('commentinfo')}]//a[contains(@href, 'comment?id')])[1]"
+)
+_COMMENT_CONTENTS_XPATH = etree.XPath(
+    f"(.//*[{_class_predicate('comment_contents')}])[1]"
+)
+
+
+def _element_text(element, separator: str = "\n") -> str:
+    """lxml 요소의 텍스트 노드를 공백 제거 후 separator로 연결합니다."""
+    return separator.join(
+        text for text in (part.strip() for part in element.itertext()) if text
+    )
+
+
+def _has_class(element, name: str) -> bool:
+    """lxml 요소의 class 속성에 name 토큰이 있는지 확인합니다."""
+    return name in (element.get("class") or "").split()
+
+
+def _in_comment_thread(element) -> bool:
+    """lxml 요소가 댓글 영역(#comment_thread 또는 .comment_thread) 안에 있는지 확인합니다."""
+    return any(
+        ancestor.get("id") == _COMMENT_THREAD or _has_class(ancestor, _COMMENT_THREAD)
+        for ancestor in element.iterancestors()
+    )
+
+
+def _has_ancestor(tag: Tag, name: str | None, root: Tag) -> bool:
+    """
+    root에 이르기 전에 name 태그인 조상이 있는지 확인합니다.
+
+    name이 None이면 tag가 아직 root 하위에 연결되어 있는지 확인합니다.
+    """
+    parent = tag.parent
+    while parent is not None:
+        if parent is root:
+            return name is None
+        if parent.name == name:
+            return True
+        parent = parent.parent
+    return False
+
+
+class TopicRegionStrainer(SoupStrainer):
+    """
+    GeekNews 토픽 페이지에서 추출에 필요한 영역만 파싱하는 SoupStrainer
+
+    <title>, <meta>와 토픽 영역(.topictitle, .topicinfo, .topic_contents)만
+    트리로 생성합니다. 댓글 영역은 _extract_comments에서 별도로 스트리밍 파싱합니다.
+    일치한 요소의 하위 요소는 모두 유지되고, 그 밖의 script/style/svg 등은
+    Tag 객체로 만들지 않습니다.
+    """
+
+    # 파싱 대상 태그 이름
+    TAG_NAMES = frozenset({"title", "meta"})
+
+    # 파싱 대상 영역 클래스
+    TOPIC_CLASSES = frozenset({"topictitle", "topicinfo", "topic_contents"})
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name in self.TAG_NAMES:
+            return True
+        if not attrs:
+            return False
+
+        classes = attrs.get("class") or ""
+        class_set = set(classes.split() if isinstance(classes, str) else classes)
+        return not self.TOPIC_CLASSES.isdisjoint(class_set)
+
 
 class GeekNewsCrawler(BaseCrawler):
     """
@@ -41,7 +235,7 @@ class GeekNewsCrawler(BaseCrawler):
     """
 
     platform_name: str = "geeknews"
-    URL_PATTERN: str = r"https?://(www\.)?news\.hada\.io/topic\?id=\d+"
+    URL_PATTERN: str = _URL_RE.pattern
 
     # GeekNews 특화 노이즈 요소 선택자
     NOISE_SELECTORS: list[str] = [
@@ -58,6 +252,9 @@ class GeekNewsCrawler(BaseCrawler):
         "form",
     ]
 
+    # 토픽 페이지 파싱 범위 (댓글 영역 제외)
+    CONTENT_STRAINER: SoupStrainer = TopicRegionStrainer()
+
     def __init__(
         self,
         include_comments: bool = False,
@@ -101,7 +298,11 @@ class GeekNewsCrawler(BaseCrawler):
         Returns:
             유효한 GeekNews URL이면 True
         """
-        return bool(re.match(self.URL_PATTERN, url))
+        # 정규식 대신 접두사 비교 후 id 첫 글자가 숫자(\d)인지만 확인 (_URL_RE.match와 동일)
+        if not url.startswith(_URL_PREFIXES):
+            return False
+        id_start = url.index("?id=") + 4
+        return url[id_start : id_start + 1].isdecimal()
 
     async def extract(self, url: str) -> CrawledArticle | None:
         """
@@ -110,9 +311,10 @@ class GeekNewsCrawler(BaseCrawler):
         전체 크롤링 파이프라인:
         1. validate_url()로 URL 검증
         2. fetch_html()로 HTML 가져오기
-        3. parse_html()로 BeautifulSoup 파싱
-        4. _parse_content()로 구조화된 데이터 추출
-        5. (옵션) crawl_original=True인 경우 원본 외부 링크 크롤링
+        3. parse_html_strained()로 토픽 영역만 BeautifulSoup 파싱
+        4. (옵션) include_comments=True인 경우 _extract_comments()로 댓글 스트리밍 파싱
+        5. _parse_content()로 구조화된 데이터 추출
+        6. (옵션) crawl_original=True인 경우 원본 외부 링크 크롤링
 
         Args:
             url: 크롤링할 GeekNews 아티클 URL
@@ -130,11 +332,14 @@ class GeekNewsCrawler(BaseCrawler):
         if html is None:
             return None
 
-        # HTML 파싱
-        soup = self.parse_html(html)
+        # HTML 파싱 (추출에 필요한 토픽 영역만)
+        soup = self.parse_html_strained(html, self.CONTENT_STRAINER)
+
+        # 댓글 추출 (옵션, 댓글 영역은 트리 전체를 만들지 않고 스트리밍 파싱)
+        comments = self._extract_comments(html) if self.include_comments else None
 
         # 콘텐츠 추출
-        article = self._parse_content(soup, url)
+        article = self._parse_content(soup, url, comments)
 
         if article is None:
             return None
@@ -146,27 +351,25 @@ class GeekNewsCrawler(BaseCrawler):
                 article.metadata.original_url
             )
 
-            # 새 CrawledArticle 생성 (Pydantic 모델은 불변이므로 재생성)
-            article = CrawledArticle(
-                title=article.title,
-                content=article.content,
-                url=article.url,
-                platform=article.platform,
-                crawled_at=article.crawled_at,
-                metadata=article.metadata,
-                secondary_urls=article.secondary_urls,
-                original_content=original_content,
-            )
+            # 원본 콘텐츠만 교체한 사본 생성 (필드 재검증 없음)
+            article = article.model_copy(update={"original_content": original_content})
 
         return article
 
-    def _parse_content(self, soup: BeautifulSoup, url: str) -> CrawledArticle | None:
+    def _parse_content(
+        self,
+        soup: BeautifulSoup,
+        url: str,
+        comments: list[dict] | None = None,
+    ) -> CrawledArticle | None:
         """
         BeautifulSoup에서 GeekNews 아티클 데이터를 추출합니다.
 
         Args:
             soup: BeautifulSoup 객체
             url: 원본 URL
+            comments: _extract_comments()로 추출한 댓글 목록
+                (None이면 댓글 없이 .topicinfo의 댓글 수만 사용)
 
         Returns:
             CrawledArticle 객체 또는 실패 시 None
@@ -187,17 +390,12 @@ class GeekNewsCrawler(BaseCrawler):
             # 본문 내용 추출
             main_content = self._extract_main_content(soup)
 
-            # 댓글 추출 (옵션)
-            comments = []
-            if self.include_comments:
-                comments = self._extract_comments(soup)
-
             # 전체 콘텐츠 조합
             content = self._build_content(
                 original_url=original_url,
                 meta_info=meta_info,
                 main_content=main_content,
-                comments=comments,
+                comments=comments or [],
             )
 
             # OG 메타데이터 추출
@@ -214,7 +412,7 @@ class GeekNewsCrawler(BaseCrawler):
                 author=meta_info.get("author"),
                 published_at=meta_info.get("published_time"),
                 comment_count=len(comments)
-                if self.include_comments
+                if comments is not None
                 else self._get_comment_count(soup),
                 topic_id=topic_id,
             )
@@ -246,12 +444,12 @@ class GeekNewsCrawler(BaseCrawler):
         3. <title> 태그 (fallback)
         """
         # .topictitle h1
-        title_elem = soup.select_one(".topictitle h1")
+        title_elem = _TITLE_H1_SEL.select_one(soup)
         if title_elem:
             return self.text_extractor.clean_text(title_elem.get_text(strip=True))
 
         # .topictitle a.ud
-        title_link = soup.select_one(".topictitle a.ud")
+        title_link = _TITLE_LINK_SEL.select_one(soup)
         if title_link:
             return self.text_extractor.clean_text(title_link.get_text(strip=True))
 
@@ -260,7 +458,7 @@ class GeekNewsCrawler(BaseCrawler):
         if title_tag:
             title_text = title_tag.get_text(strip=True)
             # " | GeekNews" 접미사 제거
-            return re.sub(r"\s*\|\s*GeekNews\s*$", "", title_text)
+            return _TITLE_SUFFIX_RE.sub("", title_text)
 
         return ""
 
@@ -270,7 +468,7 @@ class GeekNewsCrawler(BaseCrawler):
 
         GeekNews 내부 링크는 제외합니다.
         """
-        link_elem = soup.select_one(".topictitle a.ud")
+        link_elem = _TITLE_LINK_SEL.select_one(soup)
         if link_elem:
             href = link_elem.get("href", "")
             # 내부 링크 제외 (/, news.hada.io)
@@ -290,29 +488,29 @@ class GeekNewsCrawler(BaseCrawler):
         """
         meta_info = {}
 
-        info_elem = soup.select_one(".topicinfo")
+        info_elem = _TOPICINFO_SEL.select_one(soup)
         if not info_elem:
             return meta_info
 
         info_text = info_elem.get_text(strip=True)
 
         # 포인트 추출 (숫자P 패턴)
-        points_match = re.search(r"(\d+)P", info_text)
+        points_match = _POINTS_RE.search(info_text)
         if points_match:
             meta_info["points"] = points_match.group(1)
 
         # 작성자 추출
-        author_link = info_elem.select_one("a[href*='/user']")
+        author_link = _AUTHOR_LINK_SEL.select_one(info_elem)
         if author_link:
             meta_info["author"] = author_link.get_text(strip=True)
 
         # 게시 시간 추출 (ISO 형식)
-        time_elem = info_elem.select_one("span[title]")
+        time_elem = _TIME_SPAN_SEL.select_one(info_elem)
         if time_elem:
             meta_info["published_time"] = time_elem.get("title", "")
         else:
             # 상대 시간 fallback
-            time_match = re.search(r"(\d+[일시분초]+\s*전)", info_text)
+            time_match = _REL_TIME_RE.search(info_text)
             if time_match:
                 meta_info["relative_time"] = time_match.group(1)
 
@@ -324,12 +522,12 @@ class GeekNewsCrawler(BaseCrawler):
 
         선택자: .topic_contents
         """
-        content_elem = soup.select_one(".topic_contents")
+        content_elem = _TOPIC_CONTENTS_SEL.select_one(soup)
         if not content_elem:
             return ""
 
         # 내부 콘텐츠 요소 찾기
-        inner_content = content_elem.select_one("#topic_contents, span")
+        inner_content = _INNER_CONTENT_SEL.select_one(content_elem)
         target_elem = inner_content if inner_content else content_elem
 
         return self._format_content(target_elem)
@@ -347,77 +545,98 @@ class GeekNewsCrawler(BaseCrawler):
         if element is None:
             return ""
 
-        # ul/li → bullet point
-        for ul in element.find_all("ul"):
-            for li in ul.find_all("li"):
-                if li.string:
-                    li.string = f"• {li.string}"
+        # 변환 대상 태그를 한 번의 순회로 수집 (문서 순서)
+        replace_targets = []
+        for tag in element.find_all(_FORMAT_TAGS):
+            if tag.name != "li":
+                replace_targets.append(tag)
+            # ul/li → bullet point
+            elif _has_ancestor(tag, "ul", element):
+                if tag.string:
+                    tag.string = f"• {tag.string}"
                 else:
-                    li.insert(0, "• ")
-
-        # h1-h6 → # 헤더
-        for i in range(1, 7):
-            for header in element.find_all(f"h{i}"):
-                text = header.get_text(strip=True)
-                header.string = f"\n{'#' * i} {text}\n"
-
-        # blockquote → > 인용구
-        for bq in element.find_all("blockquote"):
-            text = bq.get_text(strip=True)
-            bq.string = f"\n> {text}\n"
-
-        # code → `코드`
-        for code in element.find_all("code"):
-            text = code.get_text(strip=True)
-            code.string = f"`{text}`"
+                    tag.insert(0, "• ")
+
+        # h1-h6 → # 헤더, blockquote → > 인용구, code → `코드`
+        # 단계별 변환과 같은 순서(h1→h6→blockquote→code)로 적용
+        for tag in sorted(replace_targets, key=lambda t: _REPLACE_ORDER[t.name]):
+            # 상위 요소가 먼저 텍스트로 치환되어 분리된 요소는 건너뜀
+            if not _has_ancestor(tag, None, element):
+                continue
+            text = tag.get_text(strip=True)
+            if tag.name == "blockquote":
+                tag.string = f"\n> {text}\n"
+            elif tag.name == "code":
+                tag.string = f"`{text}`"
+            else:
+                tag.string = f"\n{_HEADER_PREFIX[tag.name]} {text}\n"
 
         # 텍스트 추출 및 정리
         text = element.get_text(separator="\n", strip=True)
         return self.text_extractor.clean_text(text)
 
-    def _extract_comments(self, soup: BeautifulSoup) -> list[dict]:
+    def _extract_comments(self, html: str) -> list[dict]:
         """
         댓글을 추출합니다.
 
         HTML 구조: <div class="comment_row" style="--depth:N"> ... </div>
 
+        댓글이 수백 개인 페이지에서도 전체 DOM을 만들지 않도록 lxml iterparse로
+        스트리밍 파싱하며, 처리한 댓글 행은 즉시 트리에서 제거합니다.
+
+        Args:
+            html: GeekNews 토픽 페이지 HTML
+
         Returns:
             댓글 딕셔너리 목록 (depth, author, time, content 포함)
         """
         comments = []
 
-        # 댓글 컨테이너 찾기
-        comment_thread = soup.select_one("#comment_thread, .comment_thread")
-        if comment_thread is None:
-            return comments
-
-        # 개별 댓글 행 순회
-        for comment_row in comment_thread.select(".comment_row"):
-            comment = {}
-
-            # Depth 추출 (style="--depth:0")
-            style = comment_row.get("style", "")
-            depth_match = re.search(r"--depth:(\d+)", style)
-            comment["depth"] = int(depth_match.group(1)) if depth_match else 0
-
-            # 작성자
-            author_elem = comment_row.select_one(".commentinfo a[href*='/user']")
-            if author_elem:
-                comment["author"] = author_elem.get_text(strip=True)
-
-            # 시간
-            time_elem = comment_row.select_one(".commentinfo a[href*='comment?id']")
-            if time_elem:
-                comment["time"] = time_elem.get_text(strip=True)
-
-            # 내용 추출
-            content_elem = comment_row.select_one(".comment_contents")
-            if content_elem:
-                raw_text = content_elem.get_text(separator="\n", strip=True)
-                comment["content"] = self.text_extractor.clean_text(raw_text)
-
-            if comment.get("content"):
-                comments.append(comment)
+        events = etree.iterparse(
+            io.BytesIO(html.encode("utf-8")),
+            events=("end",),
+            tag="div",
+            html=True,
+            recover=True,
+            encoding="utf-8",
+        )
+        for _, comment_row in events:
+            if not _has_class(comment_row, _COMMENT_ROW):
+                continue
+
+            if _in_comment_thread(comment_row):
+                comment = {}
+
+                # Depth 추출 (style="--depth:0")
+                style = comment_row.get("style", "")
+                depth_match = _DEPTH_RE.search(style)
+                comment["depth"] = int(depth_match.group(1)) if depth_match else 0
+
+                # 작성자
+                author_elems = _COMMENT_AUTHOR_XPATH(comment_row)
+                if author_elems:
+                    comment["author"] = _element_text(author_elems[0], "")
+
+                # 시간
+                time_elems = _COMMENT_TIME_XPATH(comment_row)
+                if time_elems:
+                    comment["time"] = _element_text(time_elems[0], "")
+
+                # 내용 추출
+                content_elems = _COMMENT_CONTENTS_XPATH(comment_row)
+                if content_elems:
+                    raw_text = _element_text(content_elems[0])
+                    comment["content"] = self.text_extractor.clean_text(raw_text)
+
+                if comment.get("content"):
+                    comments.append(comment)
+
+            # 처리한 댓글 행과 이전 형제 요소를 제거하여 메모리 사용량을 일정하게 유지
+            comment_row.clear(keep_tail=True)
+            parent = comment_row.getparent()
+            if parent is not None:
+                while comment_row.getprevious() is not None:
+                    del parent[0]
 
         return comments
 
@@ -427,15 +646,15 @@ class GeekNewsCrawler(BaseCrawler):
 
         .topicinfo 내 "댓글 N개" 패턴에서 추출합니다.
         """
-        info_elem = soup.select_one(".topicinfo")
+        info_elem = _TOPICINFO_SEL.select_one(soup)
         if not info_elem:
             return 0
 
-        comment_link = info_elem.find("a", string=re.compile(r"댓글\s*\d+개"))
-        if comment_link:
-            match = re.search(r"(\d+)", comment_link.get_text())
+        # 문자열 노드마다 정규식을 돌리는 string= 필터 대신 링크 텍스트를 직접 검사
+        for link in info_elem.find_all("a"):
+            match = _COMMENT_COUNT_LINK_RE.search(link.get_text())
             if match:
-                return int(match.group(1))
+                return int(_COMMENT_COUNT_NUM_RE.search(match.group()).group(1))
 
         return 0
 
@@ -445,7 +664,7 @@ class GeekNewsCrawler(BaseCrawler):
 
         예: https://news.hada.io/topic?id=24268 → "24268"
         """
-        id_match = re.search(r"id=(\d+)", url)
+        id_match = _ID_RE.search(url)
         return id_match.group(1) if id_match else None
 
     def _build_content(
@@ -482,23 +701,23 @@ class GeekNewsCrawler(BaseCrawler):
             content_parts.append(f"## 댓글 ({len(comments)}개)")
             content_parts.append("")
 
-            for _i, comment in enumerate(comments, 1):
+            for comment in comments:
                 depth = comment.get("depth", 0)
-                indent = "  " * depth
+                indent = _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
                 marker = "↳ " if depth > 0 else ""
 
                 author = comment.get("author", "Anonymous")
                 time = comment.get("time", "")
                 content = comment.get("content", "")
 
-                # 헤더 (번호, 작성자, 시간)
-                header = f"{indent}{marker}**{author}** ({time})"
-                content_parts.append(header)
+                # 내용 (멀티라인인 경우 각 줄 들여쓰기 유지)
+                if indent:
+                    content = content.replace("\n", f"\n{indent}")
 
-                # 내용 (멀티라인인 경우 들여쓰기 유지)
-                content_lines = content.split("\n")
-                for line in content_lines:
-                    content_parts.append(f"{indent}{line}")
+                # 헤더 (작성자, 시간) + 내용을 한 블록으로 추가
+                content_parts.append(
+                    f"{indent}{marker}**{author}** ({time})\n{indent}{content}"
+                )
                 content_parts.append("")
 
         return "\n".join(content_parts)
@@ -513,6 +732,8 @@ class GeekNewsCrawler(BaseCrawler):
 
         trafilatura 라이브러리를 사용하여 다양한 웹페이지에서
         본문 텍스트를 안정적으로 추출합니다.
+        CPU 작업인 본문 추출은 스레드에서 실행하여, 그동안 이벤트 루프가
+        다른 요청의 네트워크 I/O를 계속 처리할 수 있게 합니다.
 
         Args:
             original_url: 원본 외부 링크 URL
@@ -529,9 +750,39 @@ class GeekNewsCrawler(BaseCrawler):
                 logger.warning(f"Failed to fetch original URL: {original_url}")
                 return ""
 
+            return await asyncio.to_thread(
+                self._extract_original_text, html, original_url
+            )
+
+        except Exception as e:
+            logger.error(f"Error crawling original content from {original_url}: {e}")
+            return ""
+
+    def _extract_original_text(self, html: str, original_url: str) -> str:
+        """
+        원본 외부 링크 HTML에서 본문 텍스트를 추출합니다.
+
+        trafilatura를 우선 사용하고, 결과가 불충분하면 fallback 추출을 시도합니다.
+        HTML은 한 번만 파싱하여 trafilatura와 fallback 추출이 같은 트리를
+        공유합니다. (trafilatura는 전달받은 트리를 복사해서 정리하므로
+        원본 트리는 fallback에서 그대로 사용할 수 있습니다.)
+
+        Args:
+            html: 원본 외부 링크 HTML
+            original_url: 원본 외부 링크 URL (로그용)
+
+        Returns:
+            추출된 텍스트 콘텐츠 또는 실패 시 빈 문자열
+        """
+        try:
+            tree = trafilatura.load_html(html)
+            if tree is None:
+                logger.warning(f"Failed to parse original HTML: {original_url}")
+                return ""
+
             # trafilatura로 본문 추출
             content = trafilatura.extract(
-                html,
+                tree,
                 include_comments=False,  # 댓글 제외
                 include_tables=True,  # 테이블 포함
                 no_fallback=False,  # fallback 알고리즘 사용
@@ -549,7 +800,7 @@ class GeekNewsCrawler(BaseCrawler):
             logger.warning(
                 f"trafilatura extraction insufficient, trying fallback: {original_url}"
             )
-            fallback_content = self._extract_content_fallback(html)
+            fallback_content = self._extract_content_fallback(tree)
 
             if fallback_content:
                 logger.info(
@@ -565,69 +816,35 @@ class GeekNewsCrawler(BaseCrawler):
             logger.error(f"Error crawling original content from {original_url}: {e}")
             return ""
 
-    def _extract_content_fallback(self, html: str) -> str:
+    def _extract_content_fallback(self, tree: etree._Element) -> str:
         """
         trafilatura 실패 시 사용하는 fallback 본문 추출.
 
         일반적인 아티클 HTML 구조에서 본문을 추출합니다.
+        trafilatura가 파싱한 lxml 트리를 재사용하며, 트리를 직접 수정합니다.
 
         Args:
-            html: HTML 문자열
+            tree: 원본 HTML의 lxml 트리
 
         Returns:
             추출된 텍스트 콘텐츠
         """
         try:
-            soup = self.parse_html(html)
-
-            # 노이즈 요소 제거
-            noise_selectors = [
-                "script",
-                "style",
-                "nav",
-                "header",
-                "footer",
-                "aside",
-                ".sidebar",
-                ".advertisement",
-                ".ad",
-                ".social-share",
-                ".comments",
-                ".related-posts",
-                "iframe",
-                ".nav",
-                ".menu",
-                ".navigation",
-            ]
-            clean_soup = self.text_extractor.remove_noise_elements(
-                soup, noise_selectors
-            )
-
-            # 본문 추출 우선순위 (일반적인 아티클 구조)
-            content_selectors = [
-                "article",
-                '[role="main"]',
-                "main",
-                ".post-content",
-                ".article-content",
-                ".entry-content",
-                ".content",
-                ".post-body",
-                "#content",
-                ".prose",  # Tailwind CSS 기반 사이트
-            ]
-
-            for selector in content_selectors:
-                content_elem = clean_soup.select_one(selector)
-                if content_elem:
-                    text = content_elem.get_text(separator="\n", strip=True)
+            # 노이즈 요소 제거 (tail 텍스트는 유지)
+            for element in _FALLBACK_NOISE_XPATH(tree):
+                element.drop_tree()
+
+            for xpath in _FALLBACK_CONTENT_XPATHS:
+                matches = xpath(tree)
+                if matches:
+                    text = _element_text(matches[0])
                     if len(text) > 200:  # 최소 200자 이상이어야 유효
                         return self.text_extractor.clean_text(text)
 
             # Fallback: body 전체에서 추출
-            body = clean_soup.find("body")
-            if body:
-                text = body.get_text(separator="\n", strip=True)
+            body = tree.find(".//body")
+            if body is not None:
+                text = _element_text(body)
                 if len(text) > 200:
                     return self.text_extractor.clean_text(text)
 
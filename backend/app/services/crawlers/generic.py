@@ -17,13 +17,12 @@ Usage:
 """
 
 import re
-from urllib.parse import urlparse
 
 import trafilatura
 from bs4 import BeautifulSoup
 from loguru import logger
 
-from app.services.crawlers.base import BaseCrawler
+from app.services.crawlers.base import BaseCrawler, normalize_domain
 from app.services.crawlers.schemas import CrawledArticle
 
 
@@ -119,11 +118,14 @@ class GenericCrawler(BaseCrawler):
     # 추상 메서드 구현
     # ─────────────────────────────────────────────────────────────────────────
 
-    def validate_url(self, url: str) -> bool:
+    @classmethod
+    def validate_url(cls, url: str) -> bool:
         """
         URL이 유효한 HTTP/HTTPS URL인지 검증합니다.
 
         지원하지 않는 도메인(YouTube, Twitter 등)은 제외됩니다.
+        인스턴스 상태를 쓰지 않으므로 CrawlerFactory는 인스턴스 생성 없이
+        클래스에서 바로 호출합니다.
 
         Args:
             url: 검증할 URL
@@ -132,19 +134,14 @@ class GenericCrawler(BaseCrawler):
             유효한 URL이면 True
         """
         # 기본 URL 패턴 검사
-        if not re.match(self.URL_PATTERN, url):
+        if not re.match(cls.URL_PATTERN, url):
             return False
 
         # 지원하지 않는 도메인 검사
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            domain = normalize_domain(url)
 
-            # www. 접두사 제거
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            for unsupported in self.UNSUPPORTED_DOMAINS:
+            for unsupported in cls.UNSUPPORTED_DOMAINS:
                 if domain == unsupported or domain.endswith(f".{unsupported}"):
                     logger.warning(f"Unsupported domain for generic crawler: {domain}")
                     return False
@@ -350,7 +347,7 @@ class GenericCrawler(BaseCrawler):
         try:
             # 노이즈 요소 제거
             clean_soup = self.text_extractor.remove_noise_elements(
-                soup, self.NOISE_SELECTORS
+                soup, self.NOISE_SELECTORS_COMPILED
             )
 
             # 본문 추출 우선순위에 따라 시도
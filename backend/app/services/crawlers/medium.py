@@ -20,8 +20,11 @@ Usage:
 """
 
 import asyncio
+import copy
 import json
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from urllib.parse import urlparse
 
 import trafilatura
@@ -30,7 +33,11 @@ from loguru import logger
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright.async_api import async_playwright
 
-from app.services.crawlers.base import BaseCrawler, BaseTextExtractor
+from app.services.crawlers.base import (
+    BaseCrawler,
+    BaseTextExtractor,
+    compile_selectors,
+)
 from app.services.crawlers.schemas import CrawledArticle
 
 
@@ -58,6 +65,7 @@ class MediumTextExtractor(BaseTextExtractor):
         ".speechify-ignore",
         ".grecaptcha-badge",
     ]
+    REMOVE_SELECTORS_COMPILED = compile_selectors(REMOVE_SELECTORS)
 
     # Freedium 노이즈 텍스트 패턴 (이 텍스트가 포함된 요소와 그 이후 형제 요소를 제거)
     FREEDIUM_NOISE_TEXTS = [
@@ -66,13 +74,17 @@ class MediumTextExtractor(BaseTextExtractor):
         "fucking Cloudflare",
     ]
 
-    def clean_html(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """HTML에서 노이즈 요소를 제거합니다."""
-        soup_copy = BeautifulSoup(str(soup), "html.parser")
+    def clean_html(self, soup: BeautifulSoup, mutate: bool = False) -> BeautifulSoup:
+        """
+        HTML에서 노이즈 요소를 제거합니다.
+
+        mutate=True면 원본 트리를 직접 수정하고, 아니면 트리 복사본을 수정합니다.
+        """
+        soup_copy = soup if mutate else copy.copy(soup)
 
-        # 1. 셀렉터 기반 노이즈 제거
-        for selector in self.REMOVE_SELECTORS:
-            for element in soup_copy.select(selector):
+        # 1. 셀렉터 기반 노이즈 제거 (결합 패턴으로 1회 순회)
+        for element in self.REMOVE_SELECTORS_COMPILED.select(soup_copy):
+            if not element.decomposed:
                 element.decompose()
 
         # 2. Freedium 텍스트 기반 노이즈 제거
@@ -122,14 +134,16 @@ class MediumCrawler(BaseCrawler):
     ]
 
     # HTTP 헤더
-    DEFAULT_HEADERS: dict = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
-    }
+    DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType(
+        {
+            "User-Agent": (
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
+        }
+    )
 
     # 기본 요청 지연 (초) - Rate limiting 방지
     DEFAULT_REQUEST_DELAY: float = 0.5
@@ -383,8 +397,8 @@ class MediumCrawler(BaseCrawler):
         Freedium은 Medium 콘텐츠를 정제된 형태로 제공합니다.
         """
         try:
-            # 노이즈 제거
-            clean_soup = self.text_extractor.clean_html(soup)
+            # 노이즈 제거 (원본 soup은 이후 사용하지 않으므로 직접 수정)
+            clean_soup = self.text_extractor.clean_html(soup, mutate=True)
 
             # 제목 추출
             title = self._extract_freedium_title(clean_soup)
@@ -560,7 +574,10 @@ class MediumCrawler(BaseCrawler):
         Medium은 JavaScript 렌더링을 사용하므로 일부 콘텐츠만 추출될 수 있습니다.
         """
         try:
-            clean_soup = self.text_extractor.clean_html(soup)
+            # OG 메타데이터 추출 (노이즈 제거 전 원본에서)
+            og_meta = self.extract_og_meta(soup)
+
+            clean_soup = self.text_extractor.clean_html(soup, mutate=True)
 
             # 메타데이터 추출
             meta_info = self._extract_medium_metadata(clean_soup)
@@ -574,9 +591,6 @@ class MediumCrawler(BaseCrawler):
             # 제목 결정
             title = meta_info.get("title", "Untitled Medium Article")
 
-            # OG 메타데이터 추출
-            og_meta = self.extract_og_meta(soup)
-
             # ArticleMetadata 생성
             metadata = self._build_metadata(
                 og_meta,
@@ -654,7 +668,7 @@ class MediumCrawler(BaseCrawler):
                 if isinstance(data, dict) and "keywords" in data:
                     keywords = data["keywords"]
                     if isinstance(keywords, list):
-                        meta["tags"] = keywords
+                        meta["tags"] = [str(k) for k in keywords]
                     elif isinstance(keywords, str):
                         meta["tags"] = [k.strip() for k in keywords.split(",")]
             except json.JSONDecodeError:
@@ -749,8 +763,8 @@ class MediumCrawler(BaseCrawler):
         Scribe.rip은 깔끔한 HTML 구조를 제공합니다.
         """
         try:
-            # 노이즈 제거
-            clean_soup = self.text_extractor.clean_html(soup)
+            # 노이즈 제거 (원본 soup은 이후 사용하지 않으므로 직접 수정)
+            clean_soup = self.text_extractor.clean_html(soup, mutate=True)
 
             # 제목 추출
             title = self._extract_scribe_title(clean_soup)
@@ -906,8 +920,8 @@ class MediumCrawler(BaseCrawler):
 
             logger.info(f"✅ trafilatura 성공! ({len(content):,} 자)")
 
-            # OG 메타데이터 추출
-            soup = self.parse_html(html)
+            # OG 메타데이터 추출 (meta/title 태그만 부분 파싱)
+            soup = self.parse_html_strained(html, self.META_STRAINER)
             og_meta = self.extract_og_meta(soup)
 
             # 제목 결정 (OG 태그 또는 title 태그)
@@ -1010,6 +1024,8 @@ class MediumCrawler(BaseCrawler):
                     include_tables=True,
                 )
 
+                # fallback에서 파싱한 soup은 메타데이터 추출에 재사용
+                soup = None
                 if not content or len(content) < 100:
                     # trafilatura 실패 시 BeautifulSoup fallback
                     logger.info(
@@ -1031,8 +1047,9 @@ class MediumCrawler(BaseCrawler):
 
                 logger.info(f"✅ Playwright 성공! ({len(content):,} 자)")
 
-                # 메타데이터 추출
-                soup = self.parse_html(html)
+                # 메타데이터 추출 (동일 HTML 재파싱 방지)
+                if soup is None:
+                    soup = self.parse_html(html)
                 og_meta = self.extract_og_meta(soup)
                 meta_info = self._extract_medium_metadata(soup)
 
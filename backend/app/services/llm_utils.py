@@ -0,0 +1,45 @@
+"""
+LLM Utilities
+
+요약/스크립트 생성 서비스(SummaryService, AudioService)가 공유하는
+LLM 호출 재시도 정책, 스트리밍 블록 분류, 콘텐츠 병합 헤더를 제공합니다.
+"""
+
+import httpx
+from google.genai.errors import ClientError, ServerError
+
+# 스트리밍 content 블록 type → (이벤트 타입, 텍스트 키)
+# reasoning 블록은 output_version에 따라 thinking 대신 사용됨
+BLOCK_DISPATCH = {
+    "thinking": ("thinking", "thinking"),
+    "reasoning": ("thinking", "reasoning"),
+    "text": ("content", "text"),
+}
+
+# _merge_content 섹션 헤더 (GeekNews 요약/코멘트 + 원본 아티클)
+MERGE_CONTENT_HEADER = "## GeekNews 요약/코멘트\n\n"
+MERGE_ORIGINAL_HEADER = "\n\n## 원본 아티클\n\n"
+
+
+def is_retryable_llm_error(exception: BaseException) -> bool:
+    """
+    LLM 호출 예외가 재시도할 만한 일시적 오류인지 판단합니다.
+
+    langchain이 원본 예외를 감싸서 다시 던지므로 __cause__ 체인까지 확인합니다.
+    재시도 대상: 5xx 서버 오류, 429 rate limit, 네트워크 연결/타임아웃 오류.
+    그 외(4xx 요청 오류, 응답 검증 실패 등)는 재시도해도 같은 결과이므로 즉시 실패합니다.
+
+    Args:
+        exception: 발생한 예외
+
+    Returns:
+        재시도 대상이면 True
+    """
+    current: BaseException | None = exception
+    while current is not None:
+        if isinstance(current, (ServerError, httpx.TransportError)):
+            return True
+        if isinstance(current, ClientError) and current.code == 429:
+            return True
+        current = current.__cause__
+    return False
@@ -3,10 +3,15 @@ Prompt Loader
 
 마크다운 파일에서 프롬프트 템플릿을 로드하는 유틸리티입니다.
 버전 관리 및 A/B 테스트가 용이하도록 프롬프트를 파일로 분리합니다.
+
+요청마다 달라지는 변수(예: {content})는 템플릿 맨 끝에 둡니다.
+지시사항 부분이 매 요청 동일한 prefix가 되어야 Gemini의 prefix 캐시
+(implicit caching)가 적용됩니다.
 """
 
 from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 
 from loguru import logger
 
@@ -65,6 +70,35 @@ def get_prompt(version: str, name: str) -> str:
     return loader.load(version, name)
 
 
+@lru_cache(maxsize=32)
+def _compile_prompt(
+    version: str, name: str
+) -> tuple[tuple[str, str | None], ...] | None:
+    """
+    프롬프트 템플릿을 (리터럴, 변수명) 조각으로 미리 분해합니다.
+
+    format()이 호출마다 템플릿을 다시 파싱하지 않도록 결과를 캐시합니다.
+    {{ }} 이스케이프는 리터럴로 풀린 상태로 저장됩니다.
+
+    Args:
+        version: 프롬프트 버전
+        name: 프롬프트 이름
+
+    Returns:
+        (리터럴, 변수명 또는 None) 튜플 목록.
+        단순 {name} 외의 형식({0}, {a.b}, {x!r}, {x:>10} 등)이 있으면 None
+    """
+    template = get_prompt(version, name)
+    parts: list[tuple[str, str | None]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or format_spec or conversion
+        ):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
 def format_prompt(version: str, name: str, **kwargs) -> str:
     """
     프롬프트를 로드하고 변수를 대입합니다.
@@ -76,6 +110,17 @@ def format_prompt(version: str, name: str, **kwargs) -> str:
 
     Returns:
         변수가 대입된 프롬프트 문자열
+
+    Raises:
+        KeyError: 템플릿의 변수가 kwargs에 없을 경우
     """
-    template = get_prompt(version, name)
-    return template.format(**kwargs)
+    parts = _compile_prompt(version, name)
+    if parts is None:
+        return get_prompt(version, name).format(**kwargs)
+
+    return "".join(
+        [
+            literal if field_name is None else literal + format(kwargs[field_name])
+            for literal, field_name in parts
+        ]
+    )
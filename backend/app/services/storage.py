@@ -12,13 +12,17 @@ Storage Service
     users/{user_id}/audio/{article_id}.mp3
 """
 
+import asyncio
 import fnmatch
-import json
 import os
-from datetime import timedelta
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+import orjson
+from google.api_core.exceptions import NotFound
 from google.auth import default as get_default_credentials
 from google.auth.transport import requests as auth_requests
 from google.cloud import storage as gcs
@@ -30,6 +34,9 @@ from app.core.config import settings
 # 기본 로컬 데이터 디렉토리
 DEFAULT_DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+# 파일명 timestamp 캐시: (epoch 초, 포맷된 문자열)
+_path_timestamp_cache: tuple[int, str] = (0, "")
+
 
 def _get_gcs_credentials() -> service_account.Credentials | None:
     """
@@ -67,6 +74,46 @@ def _get_gcs_credentials() -> service_account.Credentials | None:
     return None
 
 
+def encode_json(data: dict) -> bytes:
+    """
+    save_bytes로 저장할 JSON bytes를 생성합니다.
+
+    save_json과 같은 형식(한글 그대로, 들여쓰기 2칸, 미지원 타입은 str)을
+    orjson으로 한 번에 UTF-8 bytes로 직렬화합니다.
+
+    Args:
+        data: 저장할 데이터
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+
+
+def now_with_path_timestamp() -> tuple[datetime, str]:
+    """
+    현재 시각과 파일명용 timestamp 문자열을 함께 반환합니다.
+
+    같은 초 안의 저장 요청은 이미 포맷된 문자열을 재사용합니다.
+    두 값은 같은 시각에서 만들어지므로 created_at과 파일명이 어긋나지 않습니다.
+
+    Returns:
+        (현재 시각, "YYYY-MM-DDTHH-MM-SS" 형식 문자열)
+    """
+    global _path_timestamp_cache
+
+    t = time.time()
+    now = datetime.fromtimestamp(t)
+    sec = int(t)
+    cached_sec, cached_str = _path_timestamp_cache
+    if sec == cached_sec:
+        return now, cached_str
+
+    timestamp = f"{now:%Y-%m-%dT%H-%M-%S}"
+    _path_timestamp_cache = (sec, timestamp)
+    return now, timestamp
+
+
 @runtime_checkable
 class StorageService(Protocol):
     """Storage 서비스 프로토콜 (인터페이스)"""
@@ -182,27 +229,50 @@ class LocalStorageService:
         """상대 경로를 절대 경로로 변환합니다."""
         return self.base_dir / path
 
+    @staticmethod
+    def _write_atomic(full_path: Path, data: bytes) -> None:
+        """
+        임시 파일에 쓴 뒤 rename으로 교체합니다 (워커 스레드에서 실행).
+
+        읽는 쪽은 항상 이전 파일 또는 완성된 새 파일만 보게 되며,
+        요청마다 fsync는 하지 않습니다.
+        """
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = full_path.with_name(
+            f".{full_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     async def save_json(self, path: str, data: dict) -> str:
         """JSON 데이터를 로컬 파일시스템에 저장합니다."""
         full_path = self._resolve_path(path)
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        await asyncio.to_thread(self._write_atomic, full_path, encode_json(data))
 
         logger.debug(f"LocalStorage: JSON 저장 완료: {full_path}")
         return str(full_path)
 
+    @staticmethod
+    def _read_bytes(full_path: Path) -> bytes | None:
+        """파일을 읽습니다 (워커 스레드에서 실행, 없으면 None)."""
+        try:
+            return full_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
     async def load_json(self, path: str) -> dict | None:
         """JSON 데이터를 로컬 파일시스템에서 로드합니다."""
         full_path = self._resolve_path(path)
 
-        if not full_path.exists():
-            return None
-
+        # 파일 읽기는 blocking I/O이므로 스레드에서 실행
         try:
-            with open(full_path, encoding="utf-8") as f:
-                return json.load(f)
+            data = await asyncio.to_thread(self._read_bytes, full_path)
+            return orjson.loads(data) if data is not None else None
         except Exception as e:
             logger.error(f"LocalStorage: JSON 로드 실패: {full_path}, error={e}")
             return None
@@ -212,10 +282,7 @@ class LocalStorageService:
     ) -> str:
         """바이너리 데이터를 로컬 파일시스템에 저장합니다."""
         full_path = self._resolve_path(path)
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(full_path, "wb") as f:
-            f.write(data)
+        await asyncio.to_thread(self._write_atomic, full_path, data)
 
         logger.debug(
             f"LocalStorage: 바이너리 저장 완료: {full_path} ({len(data)} bytes)"
@@ -226,12 +293,9 @@ class LocalStorageService:
         """바이너리 데이터를 로컬 파일시스템에서 로드합니다."""
         full_path = self._resolve_path(path)
 
-        if not full_path.exists():
-            return None
-
+        # 파일 읽기는 blocking I/O이므로 스레드에서 실행
         try:
-            with open(full_path, "rb") as f:
-                return f.read()
+            return await asyncio.to_thread(self._read_bytes, full_path)
         except Exception as e:
             logger.error(f"LocalStorage: 바이너리 로드 실패: {full_path}, error={e}")
             return None
@@ -300,8 +364,10 @@ class GCSStorageService:
     async def save_json(self, path: str, data: dict) -> str:
         """JSON 데이터를 GCS에 저장합니다."""
         blob = self.bucket.blob(path)
-        json_str = json.dumps(data, ensure_ascii=False, indent=2, default=str)
-        blob.upload_from_string(json_str, content_type="application/json")
+        # 업로드는 blocking HTTP 호출이므로 스레드에서 실행
+        await asyncio.to_thread(
+            blob.upload_from_string, encode_json(data), content_type="application/json"
+        )
 
         uri = f"gs://{self.bucket_name}/{path}"
         logger.debug(f"GCS: JSON 저장 완료: {uri}")
@@ -311,12 +377,13 @@ class GCSStorageService:
         """JSON 데이터를 GCS에서 로드합니다."""
         blob = self.bucket.blob(path)
 
-        if not blob.exists():
-            return None
-
+        # exists() + download 두 번의 요청 대신 download 한 번으로 처리하고,
+        # blocking HTTP 호출이므로 스레드에서 실행
         try:
-            json_str = blob.download_as_text()
-            return json.loads(json_str)
+            data = await asyncio.to_thread(blob.download_as_bytes)
+            return orjson.loads(data)
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(
                 f"GCS: JSON 로드 실패: gs://{self.bucket_name}/{path}, error={e}"
@@ -328,7 +395,10 @@ class GCSStorageService:
     ) -> str:
         """바이너리 데이터를 GCS에 저장합니다."""
         blob = self.bucket.blob(path)
-        blob.upload_from_string(data, content_type=content_type)
+        # 업로드는 blocking HTTP 호출이므로 스레드에서 실행
+        await asyncio.to_thread(
+            blob.upload_from_string, data, content_type=content_type
+        )
 
         uri = f"gs://{self.bucket_name}/{path}"
         logger.debug(f"GCS: 바이너리 저장 완료: {uri} ({len(data)} bytes)")
@@ -338,11 +408,12 @@ class GCSStorageService:
         """바이너리 데이터를 GCS에서 로드합니다."""
         blob = self.bucket.blob(path)
 
-        if not blob.exists():
-            return None
-
+        # exists() + download 두 번의 요청 대신 download 한 번으로 처리하고,
+        # blocking HTTP 호출이므로 스레드에서 실행
         try:
-            return blob.download_as_bytes()
+            return await asyncio.to_thread(blob.download_as_bytes)
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(
                 f"GCS: 바이너리 로드 실패: gs://{self.bucket_name}/{path}, error={e}"
@@ -14,6 +14,7 @@ ADC(Application Default Credentials) 방식으로 Vertex AI 백엔드를 사용
 import os
 import re
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from pathlib import Path
 
 from google.oauth2 import service_account
@@ -23,12 +24,18 @@ from loguru import logger
 from tenacity import (
     RetryError,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from app.core.config import settings
+from app.services.llm_utils import (
+    BLOCK_DISPATCH,
+    MERGE_CONTENT_HEADER,
+    MERGE_ORIGINAL_HEADER,
+    is_retryable_llm_error,
+)
 from app.services.prompt_loader import format_prompt
 from output_schemas.summary import SummaryResult
 
@@ -45,11 +52,19 @@ RETRY_MAX_WAIT = 10  # 최대 대기 시간 (초)
 # Thinking 설정 (기본값, settings에서 오버라이드됨)
 DEFAULT_THINKING_BUDGET = 1024  # Thinking 토큰 예산 기본값
 
+# 스트리밍 요약 파싱용 정규식 (호출마다 컴파일하지 않도록 미리 컴파일)
+_TOPIC_RE = re.compile(r"\[주제\]\s*\n(.+?)(?:\n\n|\n\[|$)", re.DOTALL)
+_SUMMARY_RE = re.compile(r"\[요약\]\s*\n(.+?)$", re.DOTALL)
+_BULLET_PREFIX_RE = re.compile(r"^[•\-\*]\s*")
+
 
+@lru_cache(maxsize=1)
 def _get_credentials() -> service_account.Credentials | None:
     """
     서비스 계정 자격 증명을 가져옵니다.
 
+    키 파일 읽기/파싱은 프로세스당 한 번만 수행하고 결과를 재사용합니다.
+
     환경변수 GOOGLE_APPLICATION_CREDENTIALS가 설정되어 있으면 해당 파일에서,
     없으면 기본 위치(~/readforme-key.json)에서 자격 증명을 로드합니다.
 
@@ -163,8 +178,10 @@ class SummaryService:
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(
+            multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception(is_retryable_llm_error),
         before_sleep=_log_retry,
         reraise=True,
     )
@@ -201,19 +218,23 @@ class SummaryService:
         Returns:
             병합된 콘텐츠 문자열
         """
-        if not original_content or not original_content.strip():
+        if not original_content:
             return content
 
-        # 두 소스를 구분하여 병합
-        merged = f"""## GeekNews 요약/코멘트
-
-{content.strip()}
-
-## 원본 아티클
-
-{original_content.strip()}"""
+        # strip은 한 번만 (앞뒤 공백이 없으면 CPython은 복사 없이 원본을 반환)
+        original_stripped = original_content.strip()
+        if not original_stripped:
+            return content
 
-        return merged
+        # 두 소스를 구분하여 병합
+        return "".join(
+            (
+                MERGE_CONTENT_HEADER,
+                content.strip(),
+                MERGE_ORIGINAL_HEADER,
+                original_stripped,
+            )
+        )
 
     async def summarize(
         self,
@@ -274,8 +295,10 @@ class SummaryService:
 
     @retry(
         stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT),
-        retry=retry_if_exception_type(Exception),
+        wait=wait_random_exponential(
+            multiplier=1, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception(is_retryable_llm_error),
         before_sleep=_log_retry,
         reraise=True,
     )
@@ -379,31 +402,24 @@ class SummaryService:
                 if not isinstance(chunk, AIMessageChunk):
                     continue
 
-                # content가 list인 경우 (thinking + text 블록)
-                if isinstance(chunk.content, list):
-                    for block in chunk.content:
-                        if isinstance(block, dict):
-                            block_type = block.get("type", "")
-                            # Thinking 블록
-                            if block_type == "thinking":
-                                thinking_text = block.get("thinking", "")
-                                if thinking_text:
-                                    yield ("thinking", thinking_text)
-                            # Reasoning 블록 (output_version에 따라 다름)
-                            elif block_type == "reasoning":
-                                reasoning_text = block.get("reasoning", "")
-                                if reasoning_text:
-                                    yield ("thinking", reasoning_text)
-                            # Text 블록
-                            elif block_type == "text":
-                                text = block.get("text", "")
-                                if text:
-                                    yield ("content", text)
-                        elif isinstance(block, str) and block:
-                            yield ("content", block)
+                chunk_content = chunk.content
                 # content가 문자열인 경우
-                elif isinstance(chunk.content, str) and chunk.content:
-                    yield ("content", chunk.content)
+                if isinstance(chunk_content, str):
+                    if chunk_content:
+                        yield ("content", chunk_content)
+                    continue
+
+                # content가 list인 경우 (thinking + text 블록)
+                for block in chunk_content:
+                    if isinstance(block, dict):
+                        dispatch = BLOCK_DISPATCH.get(block.get("type"))
+                        if dispatch is not None:
+                            event_type, text_key = dispatch
+                            text = block.get(text_key)
+                            if text:
+                                yield (event_type, text)
+                    elif isinstance(block, str) and block:
+                        yield ("content", block)
 
         except Exception as e:
             logger.error(f"스트리밍 요약 실패: {e}")
@@ -435,14 +451,12 @@ class SummaryService:
         bullet_points: list[str] = []
 
         # [주제] 파싱
-        topic_match = re.search(
-            r"\[주제\]\s*\n(.+?)(?:\n\n|\n\[|$)", full_content, re.DOTALL
-        )
+        topic_match = _TOPIC_RE.search(full_content)
         if topic_match:
             main_topic = topic_match.group(1).strip()
 
         # [요약] 파싱 - bullet points 추출
-        summary_match = re.search(r"\[요약\]\s*\n(.+?)$", full_content, re.DOTALL)
+        summary_match = _SUMMARY_RE.search(full_content)
         if summary_match:
             summary_text = summary_match.group(1).strip()
             # '•' 또는 '-' 또는 '*'로 시작하는 줄 추출
@@ -451,7 +465,7 @@ class SummaryService:
                 line = line.strip()
                 if line.startswith("•") or line.startswith("-") or line.startswith("*"):
                     # 불릿 마커 제거
-                    point = re.sub(r"^[•\-\*]\s*", "", line).strip()
+                    point = _BULLET_PREFIX_RE.sub("", line).strip()
                     if point:
                         bullet_points.append(point)
 